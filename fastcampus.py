@@ -1,18 +1,90 @@
 import asyncio
-import json
+import hashlib
+import logging
 import os
+import queue
+import re
+import shutil
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed, wait)
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
+import orjson
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
 
+def _validate_html_file(html_file):
+    """HTML 파일의 이미지 통계 수집 (프로세스 풀 작업용)."""
+    tree = lxml_html.fromstring(Path(html_file).read_bytes())
+
+    stats = {
+        'total_images': 0,
+        'broken_images': 0,
+        'empty_srcset': 0,
+        'relative_urls': 0
+    }
+
+    # img/source를 한 번의 순회로 처리
+    for node in tree.iter('img', 'source'):
+        if node.tag == 'source':
+            # 빈 srcset 체크
+            if not (node.get('srcset') or '').strip():
+                stats['empty_srcset'] += 1
+            continue
+
+        stats['total_images'] += 1
+        src = node.get('src')
+
+        # 깨진 이미지 체크
+        if not src and not node.get('data-src'):
+            stats['broken_images'] += 1
+        elif src and src.startswith('/'):
+            stats['relative_urls'] += 1
+
+    return stats
+
+
+_main_name = itemgetter('메인카테고리')
+_sub_name = itemgetter('하위카테고리')
+_course_title = itemgetter('강의제목')
+_detail_title = itemgetter('강의명')
+
+
+def _validate_main_categories(data):
+    """메인 카테고리 검증."""
+    return len(data) == 9 and all(map(_main_name, data))
+
+
+def _validate_sub_categories(data):
+    """하위 카테고리 검증."""
+    return len(data) >= 40 and all(map(_sub_name, data))
+
+
+def _validate_courses(data):
+    """강의 목록 검증."""
+    return all(_course_title(item) != "제목 없음" for item in data)
+
+
+def _validate_course_details(data):
+    """강의 상세 검증."""
+    return all(_detail_title(item) != "제목 없음" for item in data)
+
+
 class SimpleParallelCrawler:
     """FastCampus 간단한 병렬 크롤러."""
 
@@ -31,6 +103,7 @@ class SimpleParallelCrawler:
         "강의 목록 수집",
         "강의 상세 정보 수집",
         "이미지 다운로드",
+        "HTML 이미지 검증",
         "데이터 저장",
         "완료"
     ]
@@ -38,6 +111,8 @@ class SimpleParallelCrawler:
     # M3 칩 최적화 설정
     MAX_WORKERS = 4  # 스레드 풀 워커 수
     MAX_CONCURRENT_COURSES = 8  # 동시 강의 수집 수
+    TASK_TIMEOUT = 300  # 작업 하나를 기다리는 최대 시간 (초)
+    STATIC_DETAIL_MISS_LIMIT = 5  # 정적 HTML 경로가 연속으로 실패하면 이후 생략
 
     TIMEOUTS = {
         'default': 30000,
@@ -91,17 +166,76 @@ class SimpleParallelCrawler:
         'category_nav': '[data-e2e="navigation-category"]'
     }
 
+    # 강의 카드 제목 선택자 (우선순위 순)
+    TITLE_SELECTORS = [
+        '.CourseCard_courseCardTitle__1HQgO',  # 정확한 클래스명
+        '[data-e2e="display-card"]',  # data-e2e 속성
+        'h3', 'h4', '.course-title', '.title', 
+        '[data-e2e="course-title"]', '.course-name',
+        '[class*="title"]', '[class*="Title"]'
+    ]
+
+    # 강의 상세 페이지 이미지 선택자 (합집합으로 한 번에 조회)
+    LECTURE_IMAGE_SELECTOR = ', '.join([
+        'img[alt*="강의"]',  # 강의 관련 이미지
+        'img[alt*="과정"]',  # 과정 관련 이미지
+        'img[alt*="커리큘럼"]',  # 커리큘럼 이미지
+        'img[alt*="프로젝트"]',  # 프로젝트 이미지
+        'img[class*="lecture"]',  # 강의 관련 클래스
+        'img[class*="course"]',  # 코스 관련 클래스
+        'img[class*="curriculum"]',  # 커리큘럼 관련 클래스
+        'img[class*="project"]',  # 프로젝트 관련 클래스
+        'img[data-nimg="fill"]',  # Next.js 이미지
+        'img[src*="course"]',  # course가 포함된 src
+        'img[src*="lecture"]',  # lecture가 포함된 src
+        'img[src*="curriculum"]'  # curriculum이 포함된 src
+    ])
+
+    # 요청 차단 설정 (불필요한 리소스 다운로드 방지)
+    BLOCKED_RESOURCE_TYPES = {'media', 'font', 'websocket'}
+    BLOCKED_URL_PATTERNS = (
+        'googletagmanager', 'google-analytics', 'doubleclick',
+        'facebook.net'
+    )
+
     # 이미지 관련 상수
     VALID_IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg']
+    # 이미지 확장자 또는 CDN/이미지 키워드 (대소문자 무시)
+    IMAGE_URL_PATTERN = re.compile(
+        '|'.join(map(re.escape, VALID_IMAGE_EXTENSIONS 
+                     + ['cdn', 'image', 'thumbnail'])),
+        re.IGNORECASE
+    )
     MIN_IMAGE_SIZE = 1000
     MAX_THUMBNAILS = 2
 
+    # 데이터 종류별 품질 검증 함수
+    DATA_VALIDATORS = {
+        "main_categories": _validate_main_categories,
+        "sub_categories": _validate_sub_categories,
+        "courses": _validate_courses,
+        "course_details": _validate_course_details
+    }
+
     def __init__(self, base_url="https://fastcampus.co.kr/", 
-                 output_dir="./simple_parallel_crawl"):
+                 output_dir="./simple_parallel_crawl", max_workers=None,
+                 max_concurrent_courses=None):
         """크롤러 초기화."""
         self.base_url = base_url
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.max_concurrent_courses = (max_concurrent_courses 
+                                       or self.MAX_CONCURRENT_COURSES)
+
+        # HTTP 연결 재사용 세션
+        self.http = requests.Session()
+
+        # 크롤링 전체에서 공유하는 스레드 풀
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                           thread_name_prefix='fcam-worker')
+        # 워커 스레드별 Playwright 브라우저
+        self._thread_local = threading.local()
 
         self.data = {
             'main_categories': [],
@@ -109,10 +243,21 @@ class SimpleParallelCrawler:
             'courses': [],
             'course_details': []
         }
+        self.log = self._setup_logger()
         self.seen_urls = set()
+        self._seen_lock = threading.Lock()
         self.current_step = 0
         self.start_time = None
+        self._run_timestamp = None
         self.course_titles = {}
+        self.saved_html_files = []
+
+        # 강의 간 이미지 중복 다운로드 방지 (URL 해시 -> 저장 경로)
+        self._img_cache = {}
+        self._img_cache_lock = threading.Lock()
+
+        # 정적 HTML 경로가 연속으로 실패한 횟수 (한도를 넘으면 바로 브라우저 사용)
+        self._static_detail_misses = 0
 
         # 진행률 추적
         self.progress = {
@@ -124,6 +269,11 @@ class SimpleParallelCrawler:
             'completed_details': 0
         }
 
+        # 자주 쓰는 출력 경로 미리 계산
+        self._thumb_root = self.output_dir / "sumnail_images"
+        self._lecture_root = self.output_dir / "lect_images"
+        self._courses_root = self.output_dir / "courses"
+
         self._setup_directories()
         self._log_progress("간단한 병렬 크롤러 초기화 완료")
 
@@ -137,75 +287,154 @@ class SimpleParallelCrawler:
         for directory in directories:
             (self.output_dir / directory).mkdir(exist_ok=True)
 
-    def _log_progress(self, message, step=None):
+    def _setup_logger(self):
+        """로거 설정 (포맷 문자열은 출력될 때만 평가됨)."""
+        logger = logging.getLogger('fcam')
+        self._log_listener = None
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter(
+                "[%(asctime)s] [%(step)s] %(message)s", datefmt="%H:%M:%S"))
+            # 실제 출력은 백그라운드 스레드에서 처리 (워커 스레드는 큐에 넣기만 함)
+            log_queue = queue.SimpleQueue()
+            self._log_listener = QueueListener(log_queue, handler)
+            self._log_listener.start()
+            logger.addHandler(QueueHandler(log_queue))
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        return logger
+
+    def _step_name(self):
+        """현재 단계 이름."""
+        return (self.CRAWLING_STEPS[self.current_step] 
+                if self.current_step < len(self.CRAWLING_STEPS) 
+                else "알 수 없음")
+
+    def _log_progress(self, message, *args, step=None):
         """진행 상황 로깅."""
         if step is not None:
             self.current_step = step
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        step_name = (self.CRAWLING_STEPS[self.current_step] 
-                    if self.current_step < len(self.CRAWLING_STEPS) 
-                    else "알 수 없음")
+        self.log.info(message, *args, extra={'step': self._step_name()})
 
-        print(f"[{timestamp}] [{step_name}] {message}")
-        sys.stdout.flush()
+    def _log_debug(self, message, *args):
+        """상세 로깅 (DEBUG 레벨에서만 출력)."""
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(message, *args, extra={'step': self._step_name()})
 
     def _log_step_start(self, step_name):
         """단계 시작 로깅."""
         self.current_step = self.CRAWLING_STEPS.index(step_name)
-        self._log_progress(f"{step_name} 시작")
+        self._log_progress("%s 시작", step_name)
 
     def _log_step_complete(self, step_name, count=None):
         """단계 완료 로깅."""
         if count is not None:
-            self._log_progress(f"{step_name} 완료 - {count}개 항목 수집")
+            self._log_progress("%s 완료 - %d개 항목 수집", step_name, count)
         else:
-            self._log_progress(f"{step_name} 완료")
+            self._log_progress("%s 완료", step_name)
 
-    def _log_error(self, message, error=None):
+    def _log_error(self, message, *args, error=None):
         """에러 로깅."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
         if error:
-            print(f"[{timestamp}] [ERROR] {message}: {str(error)}")
+            self.log.error(message + ": %s", *args, error, extra={'step': 'ERROR'})
         else:
-            print(f"[{timestamp}] [ERROR] {message}")
-        sys.stdout.flush()
+            self.log.error(message, *args, extra={'step': 'ERROR'})
 
     def _log_progress_stats(self):
         """진행률 통계 로깅."""
         if self.progress['total_subcategories'] > 0:
             sub_pct = (self.progress['completed_subcategories'] / 
                       self.progress['total_subcategories'] * 100)
-            self._log_progress(f"하위 카테고리 진행률: {sub_pct:.1f}% "
-                             f"({self.progress['completed_subcategories']}/"
-                             f"{self.progress['total_subcategories']})")
+            self._log_progress("하위 카테고리 진행률: %.1f%% (%d/%d)", sub_pct,
+                               self.progress['completed_subcategories'],
+                               self.progress['total_subcategories'])
 
         if self.progress['total_courses'] > 0:
             course_pct = (self.progress['completed_courses'] / 
                          self.progress['total_courses'] * 100)
-            self._log_progress(f"강의 수집 진행률: {course_pct:.1f}% "
-                             f"({self.progress['completed_courses']}/"
-                             f"{self.progress['total_courses']})")
+            self._log_progress("강의 수집 진행률: %.1f%% (%d/%d)", course_pct,
+                               self.progress['completed_courses'],
+                               self.progress['total_courses'])
 
         if self.progress['total_details'] > 0:
             detail_pct = (self.progress['completed_details'] / 
                          self.progress['total_details'] * 100)
-            self._log_progress(f"강의 상세 진행률: {detail_pct:.1f}% "
-                             f"({self.progress['completed_details']}/"
-                             f"{self.progress['total_details']})")
+            self._log_progress("강의 상세 진행률: %.1f%% (%d/%d)", detail_pct,
+                               self.progress['completed_details'],
+                               self.progress['total_details'])
+
+    def _mark_seen(self, url):
+        """URL 방문 표시 (처음 본 URL이면 True, 스레드 안전)."""
+        with self._seen_lock:
+            if url in self.seen_urls:
+                return False
+            self.seen_urls.add(url)
+            return True
 
-    def _setup_browser(self, playwright):
+    def _setup_browser(self, playwright, block_images=False):
         """브라우저 설정."""
         browser = playwright.chromium.launch(headless=True)
+        _, page = self._new_page(browser, block_images)
+        return browser, page
+
+    def _new_page(self, browser, block_images=False):
+        """새 브라우저 컨텍스트와 페이지 생성."""
         context = browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent=self.HEADERS['default']['User-Agent'],
             extra_http_headers=self.HEADERS['default']
         )
+
+        blocked_types = set(self.BLOCKED_RESOURCE_TYPES)
+        if block_images:
+            blocked_types.add('image')
+
+        def route_handler(route):
+            request = route.request
+            if (request.resource_type in blocked_types
+                    or any(pattern in request.url 
+                           for pattern in self.BLOCKED_URL_PATTERNS)):
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route("**/*", route_handler)
         page = context.new_page()
         page.set_default_timeout(self.TIMEOUTS['default'])
         page.set_default_navigation_timeout(self.TIMEOUTS['navigation'])
-        return browser, page
+        return context, page
+
+    @contextmanager
+    def _worker_page(self, block_images=False):
+        """워커 스레드 전용 브라우저에서 작업용 페이지 생성.
+
+        브라우저는 스레드마다 한 번만 띄우고, 작업마다 컨텍스트만 새로 만든다.
+        """
+        if getattr(self._thread_local, 'browser', None) is None:
+            self._thread_local.playwright = sync_playwright().start()
+            self._thread_local.browser = (
+                self._thread_local.playwright.chromium.launch(headless=True))
+
+        context, page = self._new_page(self._thread_local.browser, block_images)
+        try:
+            yield page
+        finally:
+            context.close()
+
+    def _close_worker_browser(self, barrier):
+        """현재 워커 스레드의 브라우저 종료."""
+        # 모든 워커 스레드가 이 작업을 하나씩 맡도록 대기
+        try:
+            barrier.wait(timeout=60)
+        except threading.BrokenBarrierError:
+            pass
+
+        browser = getattr(self._thread_local, 'browser', None)
+        if browser is not None:
+            browser.close()
+            self._thread_local.playwright.stop()
+            self._thread_local.browser = None
 
     def _safe_page_load(self, page, url, retries=3):
         """안전한 페이지 로딩."""
@@ -231,34 +460,34 @@ class SimpleParallelCrawler:
 
         return False
 
-    def _scroll_page(self, page):
-        """동적 콘텐츠 로드를 위한 스크롤."""
-        last_height = page.evaluate("document.body.scrollHeight")
-
-        while True:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
-            new_height = page.evaluate("document.body.scrollHeight")
-
-            if new_height == last_height:
-                break
-            last_height = new_height
+    def _scroll_page(self, page, idle_timeout=3000):
+        """동적 콘텐츠 로드를 위한 스크롤 (브라우저 내부에서 한 번에 실행)."""
+        page.evaluate("""
+            async (idleTimeout) => {
+                const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+                let lastHeight = document.body.scrollHeight;
+
+                while (true) {
+                    window.scrollTo(0, document.body.scrollHeight);
+
+                    // 높이가 늘어나면 즉시 다음 스크롤, 변화가 없으면 종료
+                    const start = Date.now();
+                    while (document.body.scrollHeight === lastHeight 
+                           && Date.now() - start < idleTimeout) {
+                        await sleep(100);
+                    }
+                    if (document.body.scrollHeight === lastHeight) {
+                        break;
+                    }
+                    lastHeight = document.body.scrollHeight;
+                }
+            }
+        """, idle_timeout)
 
     def _wait_for_images_to_load(self, page, timeout=30000):
         """이미지 완전 로딩 대기."""
         try:
-            # 모든 이미지가 로드될 때까지 대기
-            page.wait_for_function("""
-                () => {
-                    const images = Array.from(document.querySelectorAll('img'));
-                    return images.every(img => {
-                        return img.complete && img.naturalHeight !== 0;
-                    });
-                }
-            """, timeout=timeout)
-
             # lazy loading 이미지들 강제 로드
-
             page.evaluate("""
                 () => {
                     const lazyImages = document.querySelectorAll('img[data-src]');
@@ -270,6 +499,15 @@ class SimpleParallelCrawler:
                 }
             """)
 
+            # 모든 이미지 디코딩 완료 대기 (폴링 없이 한 번의 호출로 대기)
+            page.evaluate("""
+                (timeout) => Promise.race([
+                    Promise.all(Array.from(document.images).map(
+                        img => img.decode().catch(() => null))),
+                    new Promise(resolve => setTimeout(resolve, timeout))
+                ])
+            """, timeout)
+
             # srcset 속성 정규화
             page.evaluate("""
                 () => {
@@ -317,7 +555,7 @@ class SimpleParallelCrawler:
 
 
         except Exception as e:
-            self._log_error(f"이미지 로딩 대기 중 오류", e)
+            self._log_error("이미지 로딩 대기 중 오류", error=e)
             return False
 
     def _prepare_navigation(self, page):
@@ -327,7 +565,6 @@ class SimpleParallelCrawler:
             popup_mask = page.locator('.fc-popup-mask')
             if popup_mask.is_visible():
                 popup_mask.evaluate('element => element.remove()')
-                page.wait_for_timeout(1000)
         except Exception:
             pass
 
@@ -351,18 +588,25 @@ class SimpleParallelCrawler:
                     button = page.locator(selector).first
                     if button.is_visible(timeout=5000):
                         button.click(timeout=10000)
-                        page.wait_for_timeout(3000)
                         clicked = True
-                        self._log_progress(f"카테고리 버튼 클릭 성공: {selector}")
+                        self._log_progress("카테고리 버튼 클릭 성공: %s", selector)
                         break
                 except Exception:
                     continue
 
+            if clicked:
+                # 카테고리 메뉴가 렌더링될 때까지 대기
+                try:
+                    page.wait_for_selector(self.SELECTORS['main_category'],
+                                           state='attached', timeout=5000)
+                except PlaywrightTimeoutError:
+                    self._log_error("카테고리 메뉴 렌더링 대기 시간 초과")
+
             if not clicked:
                 self._log_error("모든 카테고리 버튼 선택자 실패")
 
         except Exception as e:
-            self._log_error(f"네비게이션 준비 실패", e)
+            self._log_error("네비게이션 준비 실패", error=e)
 
     def _extract_main_categories(self, page):
         """메인 카테고리 추출."""
@@ -386,11 +630,11 @@ class SimpleParallelCrawler:
                     self.data['main_categories'].append({
                         "메인카테고리": name,
                         "메인카테고리링크": url,
-                        "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        "수집일시": self._run_timestamp
                     })
-                    self._log_progress(f"메인 카테고리 발견: {name}")
+                    self._log_progress("메인 카테고리 발견: %s", name)
             except Exception as e:
-                self._log_error(f"메인 카테고리 처리 중 오류 (링크 {i})", e)
+                self._log_error("메인 카테고리 처리 중 오류 (링크 %s)", i, error=e)
                 continue
 
         self._log_step_complete("메인 카테고리 수집", 
@@ -448,10 +692,9 @@ class SimpleParallelCrawler:
                 name = link.text_content().strip()
                 url = link.get_attribute('href')
 
-                if not name or not url or url in self.seen_urls:
+                if not name or not url or not self._mark_seen(url):
                     continue
 
-                self.seen_urls.add(url)
                 parent = self._find_parent_category(link)
 
                 if parent:
@@ -462,11 +705,11 @@ class SimpleParallelCrawler:
                         "메인카테고리": parent,
                         "하위카테고리": name,
                         "하위카테고리링크": url,
-                        "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        "수집일시": self._run_timestamp
                     })
-                    self._log_progress(f"하위 카테고리 발견: {parent} > {name}")
+                    self._log_progress("하위 카테고리 발견: %s > %s", parent, name)
             except Exception as e:
-                self._log_error(f"하위 카테고리 처리 중 오류 (링크 {i})", e)
+                self._log_error("하위 카테고리 처리 중 오류 (링크 %s)", i, error=e)
                 continue
 
         self.progress['total_subcategories'] = len(self.data['sub_categories'])
@@ -514,10 +757,21 @@ class SimpleParallelCrawler:
         with open(html_file, 'w', encoding='utf-8') as f:
             f.write(html_content)
 
-        # 이미지 상태 검증
-        self._validate_html_images(html_file)
+        # 이미지 상태 검증은 크롤링 후 일괄 처리
+        self.saved_html_files.append(html_file)
 
-        self._log_progress(f"HTML 저장 완료: {safe_name}.html")
+        self._log_progress("HTML 저장 완료: %s.html", safe_name)
+
+    def _save_category_html(self, category, name_key, link_key, category_type):
+        """카테고리 페이지 HTML 저장 (병렬 처리용)."""
+        with self._worker_page() as page:
+            if not self._safe_page_load(page, category[link_key]):
+                self._log_error("페이지 로드 실패: %s", category[link_key])
+                return False
+
+            self._scroll_page(page)
+            self._save_html(page, category[name_key], category_type)
+            return True
 
     def _extract_title(self, card, course_url=None):
         """강의 제목 추출."""
@@ -525,42 +779,36 @@ class SimpleParallelCrawler:
         if course_url and course_url in self.course_titles:
             return self.course_titles[course_url]
 
-        # DOM에서 추출 - 사용자가 제공한 정확한 선택자 우선 사용
-        selectors = [
-            '.CourseCard_courseCardTitle__1HQgO',  # 정확한 클래스명
-            '[data-e2e="display-card"]',  # data-e2e 속성
-            'h3', 'h4', '.course-title', '.title', 
-            '[data-e2e="course-title"]', '.course-name',
-            '[class*="title"]', '[class*="Title"]'
-        ]
-
-        for selector in selectors:
-            element = card.locator(selector).first
-            if element.count() > 0:
-                title = element.text_content().strip()
-                if (title and len(title) > 3 and not title.isdigit() 
-                    and not title.endswith('+')):
-                    return title
-
-        # 마지막 fallback - 숫자가 아닌 텍스트 찾기
-        full_text = card.text_content().strip()
-        lines = [line.strip() for line in full_text.split('\n') 
-                if line.strip()]
-
-
-
-
-
-
-
-        for line in lines:
-            if (len(line) > 3 and not line.isdigit() 
-                and not line.startswith(('+', '⚠️')) 
-                and not line.endswith('+')):
+        # DOM에서 추출 - 선택자 우선순위 탐색과 fallback을 한 번의 호출로 처리
+        title = card.evaluate("""
+            (card, selectors) => {
+                const isValid = (text) => text.length > 3 
+                    && !/^\\d+$/.test(text) && !text.endsWith('+');
+
+                for (const selector of selectors) {
+                    const element = card.querySelector(selector);
+                    if (element) {
+                        const text = (element.textContent || '').trim();
+                        if (isValid(text)) {
+                            return text;
+                        }
+                    }
+                }
 
-                return line
+                // 마지막 fallback - 숫자가 아닌 텍스트 찾기
+                const lines = (card.textContent || '').split('\\n')
+                    .map(line => line.trim());
+                for (const line of lines) {
+                    if (isValid(line) && !line.startsWith('+') 
+                        && !line.startsWith('⚠️')) {
+                        return line;
+                    }
+                }
+                return null;
+            }
+        """, self.TITLE_SELECTORS)
 
-        return "제목 없음"
+        return title or "제목 없음"
 
     def _extract_course_url(self, card):
         """강의 URL 추출."""
@@ -715,6 +963,9 @@ class SimpleParallelCrawler:
 
     def _normalize_url(self, url):
         """URL 정규화."""
+        # 이미 절대 경로인 URL은 그대로 사용
+        if url.startswith(('https://', 'http://')):
+            return url
         if url.startswith('//'):
             return 'https:' + url
         elif url.startswith('/'):
@@ -723,41 +974,91 @@ class SimpleParallelCrawler:
             return urljoin(self.base_url, url)
         return url.replace('hhttps://', 'https://')
 
-    def _download_image(self, url, retries=3):
-        """이미지 다운로드."""
+    def _url_extension(self, url):
+        """URL 경로의 확장자 추출 (urlparse 없이)."""
+        end = len(url)
+        for sep in ('?', '#'):
+            i = url.find(sep, 0, end)
+            if i >= 0:
+                end = i
+
+        scheme_end = url.find('://')
+        path_start = url.find('/', scheme_end + 3 if scheme_end >= 0 else 0, end)
+        if path_start < 0:
+            return ''
+
+        slash = url.rfind('/', path_start, end)
+        dot = url.rfind('.', slash, end)
+        return url[dot:end] if dot > slash + 1 else ''
+
+    def _download_image(self, url, path, retries=3):
+        """이미지 스트리밍 다운로드 (저장된 바이트 수 반환)."""
         for attempt in range(retries):
             try:
-                response = requests.get(
-                    url, 
-                    timeout=15, 
-                    headers=self.HEADERS['image']
-                )
-                if response.status_code == 200:
-                    return response
-                elif attempt < retries - 1:
+                with self.http.get(url, timeout=15, stream=True,
+                                   headers=self.HEADERS['image']) as response:
+                    if response.status_code == 200:
+                        length = response.headers.get('Content-Length')
+                        if length and int(length) <= self.MIN_IMAGE_SIZE:
+                            return 0
+
+                        # 버퍼 없이 청크를 바로 파일에 기록하며 크기 누적
+                        size = 0
+                        with open(path, 'wb', buffering=0) as f:
+                            for chunk in response.iter_content(64 * 1024):
+                                size += f.write(chunk)
+
+                        # 너무 작은 이미지는 저장하지 않음
+                        if size <= self.MIN_IMAGE_SIZE:
+                            path.unlink()
+                            return 0
+                        return size
+                if attempt < retries - 1:
                     time.sleep(1)
             except Exception:
                 if attempt < retries - 1:
                     time.sleep(1)
-        return None
+        return 0
+
+    def _save_image(self, url, path):
+        """이미지 저장 (이미 받은 URL은 다운로드 없이 하드링크)."""
+        # 서명이 붙은 긴 CDN URL 대신 16바이트 해시를 키로 사용
+        key = hashlib.blake2b(url.encode(), digest_size=16).digest()
+        with self._img_cache_lock:
+            cached_path = self._img_cache.get(key)
+
+        if cached_path == path and path.exists():
+            return path.stat().st_size
+
+        # 이전 실행의 파일이 다른 이미지와 하드링크로 묶여 있을 수 있으므로
+        # 덮어쓰지 않고 먼저 삭제 (그대로 쓰면 묶인 이미지가 모두 바뀜)
+        path.unlink(missing_ok=True)
+
+        if cached_path is not None and cached_path.exists():
+            try:
+                os.link(cached_path, path)
+            except OSError:
+                shutil.copyfile(cached_path, path)
+            return cached_path.stat().st_size
+
+        size = self._download_image(url, path)
+        if size:
+            with self._img_cache_lock:
+                self._img_cache.setdefault(key, path)
+        return size
 
     def _is_valid_image_url(self, url):
         """유효한 이미지 URL인지 확인."""
         if not url or len(url) < 10:
             return False
 
-        url_lower = url.lower()
-
         # URL에 이미지 확장자가 있거나, CDN URL인 경우
-        return (any(ext in url_lower for ext in self.VALID_IMAGE_EXTENSIONS) 
-                or 'cdn' in url_lower 
-                or 'image' in url_lower
-                or 'thumbnail' in url_lower)
+        return self.IMAGE_URL_PATTERN.search(url) is not None
 
     def _collect_thumbnails(self, card, course_url):
         """썸네일 이미지 수집."""
         course_name = course_url.split('/')[-1]
-        thumbnail_dir = self.output_dir / "sumnail_images" / course_name
+        thumbnail_dir = self._thumb_root / course_name
         thumbnail_dir.mkdir(parents=True, exist_ok=True)
 
         # 정확한 썸네일 선택자만 사용 (우선순위 순)
@@ -795,23 +1096,17 @@ class SimpleParallelCrawler:
                         if not self._is_valid_image_url(url):
                             continue
 
-                        response = self._download_image(url)
-
-                        if (response and 
-                            len(response.content) > self.MIN_IMAGE_SIZE):
-                            ext = (os.path.splitext(urlparse(url).path)[1] 
-                                   or '.webp')
-                            filename = f"thumbnail_{saved_count + 1}{ext}"
-
-                            with open(thumbnail_dir / filename, 'wb') as f:
-                                f.write(response.content)
+                        ext = self._url_extension(url) or '.webp'
+                        filename = f"thumbnail_{saved_count + 1}{ext}"
+                        size = self._save_image(url, thumbnail_dir / filename)
 
+                        if size:
                             saved_urls.add(url)
                             saved_count += 1
-                            self._log_progress(f"썸네일 이미지 저장: {filename} "
-                                             f"({len(response.content)} bytes)")
+                            self._log_debug("썸네일 이미지 저장: %s (%d bytes)",
+                                            filename, size)
             except Exception as e:
-                self._log_error(f"썸네일 이미지 처리 중 오류", e)
+                self._log_error("썸네일 이미지 처리 중 오류", error=e)
                 continue
 
     def _extract_course_titles_from_json(self, page):
@@ -825,7 +1120,7 @@ class SimpleParallelCrawler:
                     if not json_text:
                         continue
 
-                    data = json.loads(json_text)
+                    data = orjson.loads(json_text)
 
                     # JSON 구조 탐색하여 강의 데이터 찾기
                     def find_courses(obj, path=""):
@@ -862,67 +1157,65 @@ class SimpleParallelCrawler:
                         self.course_titles[course['url']] = course['title']
 
                     if courses:
-                        self._log_progress(f"JSON에서 {len(courses)}개 강의 제목 "
-                                         f"추출 완료")
+                        self._log_progress("JSON에서 %d개 강의 제목 추출 완료",
+                                           len(courses))
                         return True
 
                 except Exception as e:
-                    self._log_error(f"JSON 파싱 중 오류", e)
+                    self._log_error("JSON 파싱 중 오류", error=e)
                     continue
 
         except Exception as e:
-            self._log_error(f"강의 제목 추출 중 오류", e)
+            self._log_error("강의 제목 추출 중 오류", error=e)
 
         return False
 
     def _extract_courses_from_subcategory(self, subcategory, max_courses=20):
         """하위 카테고리에서 강의 정보 추출 (병렬 처리용)."""
-        with sync_playwright() as p:
-            browser, page = self._setup_browser(p)
+        # 썸네일은 requests로 직접 받으므로 목록 페이지에서는 이미지 차단
+        with self._worker_page(block_images=True) as page:
+            self._log_progress("강의 수집 시작: %s > %s",
+                               subcategory['메인카테고리'],
+                               subcategory['하위카테고리'])
+
+            if not self._safe_page_load(page, subcategory['하위카테고리링크']):
+                self._log_error("페이지 로드 실패: %s", subcategory['하위카테고리링크'])
+                return []
+
+            self._scroll_page(page)
+
+            # 먼저 JSON에서 강의 제목들 추출
+            self._extract_course_titles_from_json(page)
+
+            # 강의 카드 컨테이너 찾기 - 여러 선택자 시도
+            card_selectors = [
+                '[data-e2e="course-card"]',
+                '.course-card', 
+                '.course-item',
+                'div[class*="CourseCard"]',
+                'div[class*="courseCard"]',
+                'div[class*="course-card"]',
+                'article[class*="course"]',
+                'div[class*="card"]'
+            ]
 
-            try:
-                self._log_progress(f"강의 수집 시작: {subcategory['메인카테고리']} > "
-                                  f"{subcategory['하위카테고리']}")
-
-                if not self._safe_page_load(page, subcategory['하위카테고리링크']):
-                    self._log_error(f"페이지 로드 실패: {subcategory['하위카테고리링크']}")
-                    return []
-
-                self._scroll_page(page)
-                page.wait_for_timeout(3000)
-
-                # 먼저 JSON에서 강의 제목들 추출
-                self._extract_course_titles_from_json(page)
-
-                # 강의 카드 컨테이너 찾기 - 여러 선택자 시도
-                card_selectors = [
-                    '[data-e2e="course-card"]',
-                    '.course-card', 
-                    '.course-item',
-                    'div[class*="CourseCard"]',
-                    'div[class*="courseCard"]',
-                    'div[class*="course-card"]',
-                    'article[class*="course"]',
-                    'div[class*="card"]'
-                ]
-
-                cards = []
-                for selector in card_selectors:
-                    found_cards = page.locator(selector).all()
-                    if found_cards:
-                        cards = found_cards
-                        self._log_progress(f"강의 카드 발견: {len(cards)}개 "
-                                         f"(선택자: {selector})")
-                        break
+            cards = []
+            for selector in card_selectors:
+                found_cards = page.locator(selector).all()
+                if found_cards:
+                    cards = found_cards
+                    self._log_progress("강의 카드 발견: %d개 (선택자: %s)",
+                                       len(cards), selector)
+                    break
 
 
 
 
-                if not cards:
-                    # 마지막 fallback - 링크 요소들을 카드로 사용
-                    cards = page.locator(self.SELECTORS['course_link']).all()
-                    self._log_progress(f"대체 선택자로 강의 카드 발견: {len(cards)}개 "
-                                     f"(선택자: {self.SELECTORS['course_link']})")
+            if not cards:
+                # 마지막 fallback - 링크 요소들을 카드로 사용
+                cards = page.locator(self.SELECTORS['course_link']).all()
+                self._log_progress("대체 선택자로 강의 카드 발견: %d개 (선택자: %s)",
+                                   len(cards), self.SELECTORS['course_link'])
 
 
 
@@ -931,337 +1224,309 @@ class SimpleParallelCrawler:
 
 
 
-                collected_courses = []
-                collected = 0
+            collected_courses = []
+            collected = 0
 
-                for i, card in enumerate(cards, 1):
-                    if collected >= max_courses:
-                        break
-
-                    try:
-                        url = self._extract_course_url(card)
-                        if not url:
-                            continue
+            for i, card in enumerate(cards, 1):
+                if collected >= max_courses:
+                    break
 
+                try:
+                    url = self._extract_course_url(card)
+                    if not url:
+                        continue
 
-                        if url.startswith('/'):
-                            url = urljoin(self.base_url, url)
-
-
-                        if '/event_online_' in url or url in self.seen_urls:
-                            continue
-
-                        self.seen_urls.add(url)
-                        title = self._extract_title(card, url)
 
-                        course_data = {
-                            "메인카테고리": subcategory['메인카테고리'],
-                            "하위카테고리": subcategory['하위카테고리'],
-                            "강의제목": title,
-                            "강의링크": url,
-                            "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        }
+                    if url.startswith('/'):
+                        url = urljoin(self.base_url, url)
 
-                        collected_courses.append(course_data)
-                        self._log_progress(f"강의 발견: {title}")
-                        self._collect_thumbnails(card, url)
-                        collected += 1
 
-                    except Exception as e:
-                        self._log_error(f"강의 처리 중 오류 (카드 {i})", e)
+                    if '/event_online_' in url or not self._mark_seen(url):
                         continue
 
-                self._log_progress(f"강의 수집 완료: {collected}개")
-                return collected_courses
+                    title = self._extract_title(card, url)
 
-            finally:
-                browser.close()
-
-    def _extract_course_detail(self, course_url):
-        """강의 상세 정보 추출 (병렬 처리용)."""
-        with sync_playwright() as p:
-            browser, page = self._setup_browser(p)
-
-            try:
-                course_name = course_url.split('/')[-1]
-                self._log_progress(f"강의 상세 정보 수집: {course_name}")
-
-                if not self._safe_page_load(page, course_url):
-                    self._log_error(f"강의 페이지 로드 실패: {course_url}")
-                    return None
-
-                self._scroll_page(page)
-                page.wait_for_timeout(3000)
-
-                # 강의 상세 페이지에서도 이미지 최적화 적용
-                self._wait_for_images_to_load(page)
-
-                # HTML 저장 전 추가 정리
-                page.evaluate("""
-                    () => {
-                        // 빈 srcset 속성 제거
-                        const sources = document.querySelectorAll('source[srcset=""]');
-                        sources.forEach(source => source.remove());
-                        
-                        // 상대 경로 이미지 URL들을 절대 경로로 변환
-                        const images = document.querySelectorAll('img[src]');
-                        const baseUrl = window.location.origin;
-                        images.forEach(img => {
-                            if (img.src.startsWith('/')) {
-                                img.src = baseUrl + img.src;
-                            } else if (img.src.startsWith('//')) {
-                                img.src = 'https:' + img.src;
-                            }
-                        });
-                        
-                        // data-src를 src로 변환 (lazy loading 해제)
-                        const lazyImages = document.querySelectorAll('img[data-src]');
-                        lazyImages.forEach(img => {
-                            if (img.dataset.src) {
-                                img.src = img.dataset.src;
-                                img.removeAttribute('data-src');
-                            }
-                        });
+                    course_data = {
+                        "메인카테고리": subcategory['메인카테고리'],
+                        "하위카테고리": subcategory['하위카테고리'],
+                        "강의제목": title,
+                        "강의링크": url,
+                        "수집일시": self._run_timestamp
                     }
-                """)
-
-                html_content = page.content()
-                safe_name = course_url.split('/')[-1]
-
-                with open(self.output_dir / f"courses/{safe_name}.html", 
-                          'w', encoding='utf-8') as f:
-                    f.write(html_content)
-
-                # 이미지 상태 검증
-                self._validate_html_images(self.output_dir / f"courses/{safe_name}.html")
-
-                self._log_progress(f"강의 HTML 저장 완료: {safe_name}.html")
-
-                soup = BeautifulSoup(html_content, 'html.parser')
-
-                title_selectors = ['h1', '[data-e2e="course-title"]', '.title']
-
-
-
-
-
-
-
-
-                title = "제목 없음"
-
-
-
-
-
-
-
-
-
-                for selector in title_selectors:
-                    element = soup.select_one(selector)
-                    if element and element.get_text().strip():
-                        title = element.get_text().strip()
-                        if title != "root layout":
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
+                    collected_courses.append(course_data)
+                    self._log_progress("강의 발견: %s", title)
+                    self._collect_thumbnails(card, url)
+                    collected += 1
 
+                except Exception as e:
+                    self._log_error("강의 처리 중 오류 (카드 %s)", i, error=e)
+                    continue
 
+            self._log_progress("강의 수집 완료: %d개", collected)
+            return collected_courses
 
+    def _extract_course_detail(self, course_url):
+        """강의 상세 정보 추출 (병렬 처리용)."""
+        course_name = course_url.split('/')[-1]
+        self._log_progress("강의 상세 정보 수집: %s", course_name)
 
+        # 서버 렌더링된 HTML로 충분하면 브라우저를 띄우지 않음
+        # (연속으로 실패하면 셸만 내려오는 사이트로 보고 추가 GET 요청을 생략)
+        if self._static_detail_misses < self.STATIC_DETAIL_MISS_LIMIT:
+            detail = self._extract_course_detail_static(course_url, course_name)
+            if detail is not None:
+                self._static_detail_misses = 0
+                return detail
+            self._static_detail_misses += 1
 
+        with self._worker_page() as page:
+            if not self._safe_page_load(page, course_url):
+                self._log_error("강의 페이지 로드 실패: %s", course_url)
+                return None
 
-                            break
+            self._scroll_page(page)
 
-                # 강의 상세 페이지에서 이미지 수집
-                self._collect_lecture_images(page, course_name)
+            # 강의 상세 페이지에서도 이미지 최적화 적용
+            self._wait_for_images_to_load(page)
 
-                self._log_progress(f"강의 상세 정보 수집 완료: {title}")
+            # HTML 저장 전 추가 정리
+            page.evaluate("""
+                () => {
+                    // 빈 srcset 속성 제거
+                    const sources = document.querySelectorAll('source[srcset=""]');
+                    sources.forEach(source => source.remove());
+
+                    // 상대 경로 이미지 URL들을 절대 경로로 변환
+                    const images = document.querySelectorAll('img[src]');
+                    const baseUrl = window.location.origin;
+                    images.forEach(img => {
+                        if (img.src.startsWith('/')) {
+                            img.src = baseUrl + img.src;
+                        } else if (img.src.startsWith('//')) {
+                            img.src = 'https:' + img.src;
+                        }
+                    });
 
-                return {
-                    "강의명": title,
-                    "강의링크": course_url,
-                    "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "추출된_텍스트": self._extract_page_content(soup)
+                    // data-src를 src로 변환 (lazy loading 해제)
+                    const lazyImages = document.querySelectorAll('img[data-src]');
+                    lazyImages.forEach(img => {
+                        if (img.dataset.src) {
+                            img.src = img.dataset.src;
+                            img.removeAttribute('data-src');
+                        }
+                    });
                 }
+            """)
 
-            finally:
-                browser.close()
-
-    def _extract_page_content(self, soup):
-        """페이지 텍스트 콘텐츠 추출."""
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-
-        main_content = soup.find('main') or soup.find('body') or soup
-        text = main_content.get_text()
+            html_content = page.content()
+            soup = BeautifulSoup(html_content, 'lxml')
+            image_urls = self._lecture_image_urls(soup, page)
 
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        return '\n'.join(lines) if lines else "텍스트 없음"
+            return self._build_course_detail(course_url, course_name,
+                                             html_content, soup, image_urls)
 
-    def _validate_html_images(self, html_file):
-        """HTML 파일의 이미지 상태 검증."""
+    def _extract_course_detail_static(self, course_url, course_name):
+        """정적 HTML 요청으로 강의 상세 정보 추출 (JS 렌더링이 필요하면 None)."""
         try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            soup = BeautifulSoup(content, 'html.parser')
-
-            # 이미지 통계 수집
-            total_images = len(soup.find_all('img'))
-            broken_images = 0
-            empty_srcset = 0
-            relative_urls = 0
+            response = self.http.get(course_url, timeout=15,
+                                     headers=self.HEADERS['default'])
+            if response.status_code != 200:
+                return None
+
+            html_content = response.content.decode('utf-8', errors='replace')
+            soup = BeautifulSoup(html_content, 'lxml')
+
+            # 제목과 본문이 모두 서버 렌더링된 경우에만 사용
+            # ("root layout"은 Next.js 셸의 제목이라 강의 페이지 근거가 아님)
+            main_content = soup.find('main')
+            if (self._extract_course_title(soup) in ("제목 없음", "root layout")
+                or main_content is None 
+                or not main_content.get_text(strip=True)):
+                return None
+
+            # 강의 고유 요소(제목 요소 또는 주소가 채워진 강의 이미지)가 없으면
+            # 셸만 내려온 페이지로 보고 브라우저 경로에서 렌더링/스크롤
+            image_urls = self._lecture_image_urls(soup)
+            has_course_title = soup.select_one('[data-e2e="course-title"]') is not None
+            has_lecture_images = bool(image_urls) and all(
+                img.get('src') for img in soup.select(self.LECTURE_IMAGE_SELECTOR))
+            if not (has_course_title or has_lecture_images):
+                return None
+        except Exception as e:
+            self._log_error("정적 HTML 요청 실패: %s", course_url, error=e)
+            return None
+
+        self._log_progress("정적 HTML로 강의 상세 수집: %s", course_name)
+        # 브라우저 경로와 같은 형태로 저장되도록 이미지 속성 정리
+        html_content = self._normalize_snapshot_html(html_content, course_url)
+        return self._build_course_detail(course_url, course_name,
+                                         html_content, soup, image_urls)
+
+    def _normalize_snapshot_html(self, html_content, page_url):
+        """저장 전 이미지 속성 정리 (브라우저 경로의 HTML 정리와 동일)."""
+        tree = lxml_html.fromstring(html_content)
+
+        # 빈 srcset 속성 제거
+        for source in tree.xpath('//source[not(normalize-space(@srcset))]'):
+            source.drop_tree()
+
+        for img in tree.iter('img'):
+            # data-src를 src로 변환 (lazy loading 해제)
+            data_src = img.get('data-src')
+            if data_src:
+                img.set('src', data_src)
+                del img.attrib['data-src']
+
+            # 상대 경로 이미지 URL들을 절대 경로로 변환
+            src = img.get('src')
+            if src and src.startswith('//'):
+                img.set('src', 'https:' + src)
+            elif src and src.startswith('/'):
+                img.set('src', urljoin(page_url, src))
+
+        return etree.tostring(tree.getroottree(), encoding='unicode',
+                              method='html')
+
+    def _lecture_image_urls(self, soup, page=None):
+        """파싱된 HTML에서 강의 이미지 URL 후보 추출."""
+        images = soup.select(self.LECTURE_IMAGE_SELECTOR)
+        urls = [img.get('src') or img.get('data-src') for img in images]
+
+        # 정적 HTML에 주소가 없는 lazy 이미지가 있을 때만 브라우저에서 다시 조회
+        if page is not None and not all(urls):
+            urls = page.eval_on_selector_all(
+                self.LECTURE_IMAGE_SELECTOR,
+                "els => els.map(e => e.getAttribute('src') "
+                "|| e.getAttribute('data-src'))"
+            )
+        return urls
+
+    def _extract_course_title(self, soup):
+        """강의 상세 페이지 제목 추출."""
+        title = "제목 없음"
+        for selector in ['h1', '[data-e2e="course-title"]', '.title']:
+            element = soup.select_one(selector)
+            if element and element.get_text().strip():
+                title = element.get_text().strip()
+                if title != "root layout":
+                    break
+        return title
+
+    def _build_course_detail(self, course_url, course_name, html_content,
+                             soup, image_urls):
+        """강의 HTML 저장, 이미지 수집 후 상세 정보 구성."""
+        html_file = self._courses_root / f"{course_name}.html"
+        with open(html_file, 'w', encoding='utf-8') as f:
+            f.write(html_content)
 
-            for img in soup.find_all('img'):
-                src = img.get('src', '')
-                data_src = img.get('data-src', '')
+        # 이미지 상태 검증은 크롤링 후 일괄 처리
+        self.saved_html_files.append(html_file)
 
-                # 깨진 이미지 체크
-                if not src and not data_src:
-                    broken_images += 1
-                elif src and (src.startswith('/') or src.startswith('//')):
-                    relative_urls += 1
+        self._log_progress("강의 HTML 저장 완료: %s.html", course_name)
 
-            # 빈 srcset 체크
-            for source in soup.find_all('source'):
-                srcset = source.get('srcset', '')
-                if not srcset or srcset.strip() == '':
-                    empty_srcset += 1
+        title = self._extract_course_title(soup)
 
-            # 검증 결과 로깅
-            if broken_images > 0 or empty_srcset > 0:
+        # 강의 상세 페이지에서 이미지 수집
+        self._collect_lecture_images(course_name, image_urls)
 
+        self._log_progress("강의 상세 정보 수집 완료: %s", title)
 
-                self._log_error(f"이미지 문제 발견: {html_file.name}")
-                self._log_error(f"  - 총 이미지: {total_images}개")
-                self._log_error(f"  - 깨진 이미지: {broken_images}개")
-                self._log_error(f"  - 빈 srcset: {empty_srcset}개")
-                self._log_error(f"  - 상대 경로: {relative_urls}개")
-            else:
-                self._log_progress(f"이미지 검증 통과: {html_file.name} "
-                                 f"({total_images}개 이미지)")
+        return {
+            "강의명": title,
+            "강의링크": course_url,
+            "수집일시": self._run_timestamp,
+            "추출된_텍스트": self._extract_page_content(html_content)
+        }
 
-        except Exception as e:
-            self._log_error(f"이미지 검증 중 오류: {html_file}", e)
+    def _extract_page_content(self, html_content):
+        """페이지 텍스트 콘텐츠 추출."""
+        tree = lxml_html.fromstring(html_content)
+        etree.strip_elements(tree, 'script', 'style', 'nav', 'footer', 'header',
+                             with_tail=False)
+
+        main_content = tree.find('.//main')
+        if main_content is None:
+            main_content = tree.find('.//body')
+        if main_content is None:
+            main_content = tree
+        text = main_content.text_content()
+
+        stripped = (line.strip() for line in text.split('\n'))
+        return '\n'.join(line for line in stripped if line) or "텍스트 없음"
+
+    def _validate_html_images(self):
+        """저장된 HTML 파일들의 이미지 상태 검증 (멀티 프로세스)."""
+        html_files = list(self.saved_html_files)
+        if not html_files:
+            return
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = {pool.submit(_validate_html_file, html_file): html_file
+                       for html_file in html_files}
+
+            for future in as_completed(futures):
+                html_file = futures[future]
+                try:
+                    stats = future.result()
+                except Exception as e:
+                    self._log_error("이미지 검증 중 오류: %s", html_file, error=e)
+                    continue
 
-    def _collect_lecture_images(self, page, course_name):
+                # 검증 결과 로깅
+                if stats['broken_images'] > 0 or stats['empty_srcset'] > 0:
+                    self._log_error("이미지 문제 발견: %s", html_file.name)
+                    self._log_error("  - 총 이미지: %s개", stats['total_images'])
+                    self._log_error("  - 깨진 이미지: %s개", stats['broken_images'])
+                    self._log_error("  - 빈 srcset: %s개", stats['empty_srcset'])
+                    self._log_error("  - 상대 경로: %s개", stats['relative_urls'])
+                else:
+                    self._log_progress("이미지 검증 통과: %s (%d개 이미지)",
+                                       html_file.name, stats['total_images'])
+
+    def _collect_lecture_images(self, course_name, raw_urls):
         """강의 상세 페이지에서 이미지 수집."""
         try:
-            lecture_dir = self.output_dir / "lect_images" / course_name
+            lecture_dir = self._lecture_root / course_name
             lecture_dir.mkdir(parents=True, exist_ok=True)
 
-            # 강의 상세 페이지의 모든 이미지 수집
-            img_selectors = [
-                'img[alt*="강의"]',  # 강의 관련 이미지
-                'img[alt*="과정"]',  # 과정 관련 이미지
-                'img[alt*="커리큘럼"]',  # 커리큘럼 이미지
-                'img[alt*="프로젝트"]',  # 프로젝트 이미지
-                'img[class*="lecture"]',  # 강의 관련 클래스
-                'img[class*="course"]',  # 코스 관련 클래스
-                'img[class*="curriculum"]',  # 커리큘럼 관련 클래스
-                'img[class*="project"]',  # 프로젝트 관련 클래스
-                'img[data-nimg="fill"]',  # Next.js 이미지
-                'img[src*="course"]',  # course가 포함된 src
-                'img[src*="lecture"]',  # lecture가 포함된 src
-                'img[src*="curriculum"]'  # curriculum이 포함된 src
-            ]
+            # 정규화 + 중복 제거 후 유효한 이미지 URL만 남김 (순서 유지)
+            urls = dict.fromkeys(self._normalize_url(url) 
+                                 for url in raw_urls if url)
+            valid_urls = [url for url in urls if self._is_valid_image_url(url)]
 
             saved_count = 0
-            saved_urls = set()
             # 갯수 제한 없이 모든 강의 관련 이미지 수집
 
-            for selector in img_selectors:
+            for url in valid_urls:
                 try:
-                    images = page.locator(selector).all()
-                    for img in images:
-
-                        url = (img.get_attribute('src') or 
-                               img.get_attribute('data-src'))
-
-                        if url:
-                            url = self._normalize_url(url)
-
-                            # 중복 URL 체크
-                            if url in saved_urls:
-                                continue
-
-                            # 유효한 이미지 URL인지 확인
-                            if not self._is_valid_image_url(url):
-                                continue
-
-                            response = self._download_image(url)
-
-                            if (response and 
-                                len(response.content) > self.MIN_IMAGE_SIZE):
-                                ext = (os.path.splitext(urlparse(url).path)[1] 
-                                       or '.webp')
-                                filename = f"lecture_{saved_count + 1}{ext}"
-
-                                with open(lecture_dir / filename, 'wb') as f:
-                                    f.write(response.content)
-
-                                saved_urls.add(url)
-                                saved_count += 1
-                                self._log_progress(f"강의 이미지 저장: {filename} "
-                                                 f"({len(response.content)} bytes)")
+                    ext = self._url_extension(url) or '.webp'
+                    filename = f"lecture_{saved_count + 1}{ext}"
+                    size = self._save_image(url, lecture_dir / filename)
+
+                    if size:
+                        saved_count += 1
+                        self._log_debug("강의 이미지 저장: %s (%d bytes)",
+                                        filename, size)
                 except Exception as e:
-                    self._log_error(f"강의 이미지 처리 중 오류", e)
+                    self._log_error("강의 이미지 처리 중 오류", error=e)
                     continue
 
             if saved_count > 0:
-                self._log_progress(f"강의 이미지 수집 완료: {saved_count}개 "
-                                 f"({course_name}) - 제한 없음")
+                self._log_progress("강의 이미지 수집 완료: %d개 (%s) - 제한 없음",
+                                   saved_count, course_name)
             else:
-                self._log_progress(f"강의 이미지 없음: {course_name}")
+                self._log_progress("강의 이미지 없음: %s", course_name)
 
         except Exception as e:
-            self._log_error(f"강의 이미지 수집 중 오류: {course_name}", e)
+            self._log_error("강의 이미지 수집 중 오류: %s", course_name, error=e)
 
     def _validate_data(self, data_type, data):
         """데이터 품질 검증."""
         if not data:
             return False
 
-        validators = {
-            "main_categories": lambda d: (len(d) == 9 and 
-                                        all(item.get('메인카테고리') 
-                                            for item in d)),
-            "sub_categories": lambda d: (len(d) >= 40 and 
-                                       all(item.get('하위카테고리') 
-                                           for item in d)),
-            "courses": lambda d: all(item.get('강의제목') != "제목 없음" 
-                                   for item in d),
-            "course_details": lambda d: all(item.get('강의명') != "제목 없음" 
-                                          for item in d)
-        }
-
-        validator = validators.get(data_type)
+        validator = self.DATA_VALIDATORS.get(data_type)
         return validator(data) if validator else True
 
     def _save_json(self, data, filename):
@@ -1270,12 +1535,22 @@ class SimpleParallelCrawler:
 
         if data and self._validate_data(data_type, data):
             json_path = self.output_dir / "json_files" / filename
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            json_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+    def _append_ndjson(self, ndjson_path, records):
+        """레코드를 한 줄에 하나씩 NDJSON 파일에 추가."""
+        if not records:
+            return
+
+        with open(ndjson_path, 'ab') as f:
+            f.write(b''.join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+                             for record in records))
 
     def run(self):
         """크롤링 실행 (병렬 처리)."""
         self.start_time = time.time()
+        # 수집일시는 실행 단위로 한 번만 포맷
+        self._run_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self._log_progress("FastCampus 병렬 크롤링 시작!")
 
         with sync_playwright() as p:
@@ -1296,53 +1571,48 @@ class SimpleParallelCrawler:
                 # 하위 카테고리 수집
                 self._extract_sub_categories(page)
 
-                # HTML 저장 (전체)
+                # HTML 저장 (병렬 처리)
                 self._log_step_start("HTML 저장")
-                self._log_progress(f"메인 카테고리 HTML 저장 시작: {len(self.data['main_categories'])}개")
-                for i, category in enumerate(self.data['main_categories'], 1):
-                    self._log_progress(f"메인 카테고리 HTML 저장 ({i}/{len(self.data['main_categories'])}): "
-                                     f"{category['메인카테고리']}")
-                    if self._safe_page_load(page, category['메인카테고리링크']):
-                        self._scroll_page(page)
-                        self._save_html(page, category['메인카테고리'], 
-                                      "main_categories")
-
-                self._log_progress(f"하위 카테고리 HTML 저장 시작: {len(self.data['sub_categories'])}개")
-                for i, category in enumerate(self.data['sub_categories'], 1):
-                    self._log_progress(f"하위 카테고리 HTML 저장 ({i}/{len(self.data['sub_categories'])}): "
-                                     f"{category['하위카테고리']}")
-                    if self._safe_page_load(page, category['하위카테고리링크']):
-                        self._scroll_page(page)
-                        self._save_html(page, category['하위카테고리'], 
-                                      "sub_categories")
-                self._log_step_complete("HTML 저장")
+                html_targets = (
+                    [(category, '메인카테고리', '메인카테고리링크', "main_categories")
+                     for category in self.data['main_categories']]
+                    + [(category, '하위카테고리', '하위카테고리링크', "sub_categories")
+                       for category in self.data['sub_categories']]
+                )
+                self._log_progress("카테고리 HTML 저장 시작: %d개 (메인 %d개, 하위 %d개)",
+                                   len(html_targets),
+                                   len(self.data['main_categories']),
+                                   len(self.data['sub_categories']))
+
+                saved_count = 0
+                for i, future in self._run_bounded(self._save_category_html,
+                                                   html_targets):
+                    try:
+                        if future.result():
+                            saved_count += 1
+                    except Exception as e:
+                        self._log_error("카테고리 HTML 저장 실패: %s", i, error=e)
+                self._log_step_complete("HTML 저장", saved_count)
 
                 # 강의 목록 수집 (병렬 처리)
                 self._log_step_start("강의 목록 수집")
                 self.progress['total_courses'] = len(self.data['sub_categories']) * 20  # 예상 강의 수
 
-                # 스레드 풀을 사용한 병렬 처리
-                with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-                    # 하위 카테고리별로 병렬 처리
-                    futures = []
-                    for subcategory in self.data['sub_categories']:
-                        future = executor.submit(
-                            self._extract_courses_from_subcategory, 
-                            subcategory, 
-                            max_courses=20
-                        )
-                        futures.append(future)
-
-                    # 결과 수집
-                    for i, future in enumerate(futures):
-                        try:
-                            courses = future.result(timeout=300)  # 5분 타임아웃
-                            if courses:
-                                self.data['courses'].extend(courses)
-                                self.progress['completed_subcategories'] += 1
-                                self._log_progress(f"하위 카테고리 완료: {i+1}/{len(futures)}")
-                        except Exception as e:
-                            self._log_error(f"하위 카테고리 처리 실패: {i+1}", e)
+                # 하위 카테고리별로 병렬 처리, 완료되는 순서대로 결과 수집
+                subcategory_args = [(subcategory, 20) 
+                                    for subcategory in self.data['sub_categories']]
+                for i, future in self._run_bounded(
+                        self._extract_courses_from_subcategory, subcategory_args):
+                    try:
+                        courses = future.result()
+                        if courses:
+                            self.data['courses'].extend(courses)
+                            self.progress['completed_subcategories'] += 1
+                            self._log_progress("하위 카테고리 완료: %d/%d",
+                                               self.progress['completed_subcategories'],
+                                               len(subcategory_args))
+                    except Exception as e:
+                        self._log_error("하위 카테고리 처리 실패: %s", i, error=e)
 
                 self._log_step_complete("강의 목록 수집", len(self.data['courses']))
 
@@ -1350,31 +1620,44 @@ class SimpleParallelCrawler:
                 self._log_step_start("강의 상세 정보 수집")
                 self.progress['total_details'] = len(self.data['courses'])
 
-                with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-                    # 강의별로 병렬 처리
-                    futures = []
-                    for course in self.data['courses']:
-                        future = executor.submit(
-                            self._extract_course_detail, 
-                            course['강의링크']
-                        )
-                        futures.append(future)
-
-                    # 결과 수집
-                    for i, future in enumerate(futures):
-                        try:
-                            detail = future.result(timeout=300)  # 5분 타임아웃
-                            if detail:
-                                self.data['course_details'].append(detail)
-                                self.progress['completed_details'] += 1
-                                if self.progress['completed_details'] % 10 == 0:
-                                    self._log_progress(f"강의 상세 완료: {self.progress['completed_details']}/{self.progress['total_details']}")
-                        except Exception as e:
-                            self._log_error(f"강의 상세 처리 실패: {i+1}", e)
+                # 강의별로 병렬 처리, 완료되는 순서대로 결과 수집
+                course_args = [(course['강의링크'],) for course in self.data['courses']]
+                # 하위 카테고리 단위로 완료되는 즉시 NDJSON에 추가 저장
+                course_groups = [course['하위카테고리'] for course in self.data['courses']]
+                remaining = Counter(course_groups)
+                group_details = defaultdict(list)
+                ndjson_path = self.output_dir / "json_files" / "course_details.ndjson"
+                ndjson_path.unlink(missing_ok=True)
+
+                for i, future in self._run_bounded(self._extract_course_detail,
+                                                   course_args):
+                    group = course_groups[i - 1]
+                    try:
+                        detail = future.result()
+                        if detail:
+                            self.data['course_details'].append(detail)
+                            group_details[group].append(detail)
+                            self.progress['completed_details'] += 1
+                            if self.progress['completed_details'] % 10 == 0:
+                                self._log_progress("강의 상세 완료: %d/%d",
+                                                   self.progress['completed_details'],
+                                                   self.progress['total_details'])
+                    except Exception as e:
+                        self._log_error("강의 상세 처리 실패: %s", i, error=e)
+
+                    remaining[group] -= 1
+                    if remaining[group] == 0:
+                        self._append_ndjson(ndjson_path, group_details.pop(group, []))
 
                 self._log_step_complete("강의 상세 정보 수집", 
                                       len(self.data['course_details']))
 
+                # 저장된 HTML 이미지 검증 (병렬 처리)
+                self._log_step_start("HTML 이미지 검증")
+                self._validate_html_images()
+                self._log_step_complete("HTML 이미지 검증", 
+                                      len(self.saved_html_files))
+
                 # 데이터 저장
                 self._log_step_start("데이터 저장")
                 self._save_json(self.data['main_categories'], 
@@ -1388,23 +1671,85 @@ class SimpleParallelCrawler:
 
                 # 완료
                 elapsed_time = time.time() - self.start_time
-                self._log_progress(f"병렬 크롤링 완료! 총 소요시간: "
-                                 f"{elapsed_time:.2f}초")
-                self._log_progress(f"수집 결과:")
-                self._log_progress(f"   - 메인 카테고리: "
-                                 f"{len(self.data['main_categories'])}개")
-                self._log_progress(f"   - 하위 카테고리: "
-                                 f"{len(self.data['sub_categories'])}개")
-                self._log_progress(f"   - 강의 목록: "
-                                 f"{len(self.data['courses'])}개")
-                self._log_progress(f"   - 강의 상세: "
-                                 f"{len(self.data['course_details'])}개")
+                self._log_progress("병렬 크롤링 완료! 총 소요시간: %.2f초",
+                                   elapsed_time)
+                self._log_progress("수집 결과:")
+                self._log_progress("   - 메인 카테고리: %d개",
+                                   len(self.data['main_categories']))
+                self._log_progress("   - 하위 카테고리: %d개",
+                                   len(self.data['sub_categories']))
+                self._log_progress("   - 강의 목록: %d개", len(self.data['courses']))
+                self._log_progress("   - 강의 상세: %d개",
+                                   len(self.data['course_details']))
 
             except Exception as e:
-                self._log_error("크롤링 중 치명적 오류 발생", e)
+                self._log_error("크롤링 중 치명적 오류 발생", error=e)
             finally:
                 browser.close()
                 self._log_progress("브라우저 종료")
+                self.close()
+
+    def _run_bounded(self, func, arg_list):
+        """동시 제출 수를 제한하며 완료 순서대로 (작업 번호, future) 반환.
+
+        TASK_TIMEOUT 안에 끝나지 않은 작업은 기다리지 않고 시간 초과 예외가
+        담긴 future로 대신 반환해 다음 작업이 계속 제출되게 한다.
+        """
+        pending = {}
+        tasks = iter(enumerate(arg_list, 1))
+
+        def submit_next():
+            for index, args in tasks:
+                deadline = time.monotonic() + self.TASK_TIMEOUT
+                pending[self.executor.submit(func, *args)] = (index, deadline)
+                return
+
+        for _ in range(self.max_concurrent_courses):
+            submit_next()
+
+        while pending:
+            next_deadline = min(deadline for _, deadline in pending.values())
+            done, _ = wait(pending, return_when=FIRST_COMPLETED,
+                           timeout=max(0, next_deadline - time.monotonic()))
+            for future in done:
+                index, _ = pending.pop(future)
+                submit_next()
+                yield index, future
+
+            now = time.monotonic()
+            expired = [future for future, (_, deadline) in pending.items()
+                       if deadline <= now and future not in done]
+            for future in expired:
+                index, _ = pending.pop(future)
+                # 실행 중인 작업은 멈출 수 없으므로 결과만 버리고,
+                # 호출 측이 실패로 기록하도록 시간 초과 예외를 담아 반환
+                future.cancel()
+                timed_out = Future()
+                timed_out.set_exception(FutureTimeoutError(
+                    f"{self.TASK_TIMEOUT}초 안에 끝나지 않아 결과를 버림"))
+                submit_next()
+                yield index, timed_out
+
+    def close(self):
+        """워커 브라우저, 스레드 풀, HTTP 세션 및 로그 리스너 종료."""
+        # sync Playwright 객체는 만든 스레드에서만 닫을 수 있음
+        barrier = threading.Barrier(self.max_workers)
+        futures = [self.executor.submit(self._close_worker_browser, barrier)
+                   for _ in range(self.max_workers)]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                self._log_error("워커 브라우저 종료 실패", error=e)
+
+        self.executor.shutdown(wait=True)
+        self.http.close()
+
+        # 큐에 남은 로그를 모두 출력한 뒤 리스너 종료
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self.log.handlers.clear()
+            self._log_listener = None
 
 
 def main():
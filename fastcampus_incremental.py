@@ -1,17 +1,35 @@
 import asyncio
 import hashlib
-import json
+import logging
 import os
+import queue
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import chain
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+
+# 이번 실행에서 수집한 강의/상세 레코드는 항상 강의링크를 가짐
+_course_link = itemgetter('강의링크')
+
+
+def _without_timestamp(items):
+    """실행마다 바뀌는 수집일시를 뺀 레코드 목록 (내용 비교용)."""
+    return [{key: value for key, value in item.items() if key != '수집일시'}
+            for item in items]
 
 
 class IncrementalCrawler:
@@ -80,12 +98,52 @@ class IncrementalCrawler:
     MIN_IMAGE_SIZE = 1000
     MAX_THUMBNAILS = 2
 
+    # 강의 카드 제목 선택자 (우선순위 순)
+    TITLE_SELECTORS = [
+        '.CourseCard_courseCardTitle__1HQgO',
+        '[data-e2e="display-card"]',
+        'h3', 'h4', '.course-title', '.title', 
+        '[data-e2e="course-title"]', '.course-name'
+    ]
+
+    # 강의 상세 페이지 제목 후보 (우선순위 순)
+    TITLE_XPATHS = [
+        '//h1',
+        '//*[@data-e2e="course-title"]',
+        '//*[contains(concat(" ", normalize-space(@class), " "), " title ")]'
+    ]
+
+    # URL -> 콘텐츠 해시 인덱스를 함께 저장하는 데이터 종류
+    HASH_INDEX_TYPES = ('courses', 'course_details')
+
+    # 데이터 종류별 비교 기준 URL 키
+    URL_KEYS = {
+        'main_categories': '메인카테고리링크',
+        'sub_categories': '하위카테고리링크',
+        'courses': '강의링크',
+        'course_details': '강의링크'
+    }
+
+    # 사람이 직접 볼 일이 적은 대용량 데이터는 들여쓰기 없이 저장
+    COMPACT_JSON_TYPES = ('courses',)
+
+    # 데이터 종류별 저장 파일 (강의 상세는 변경분만 추가하는 JSON Lines)
+    DATA_FILES = {
+        'main_categories': 'main_categories.json',
+        'sub_categories': 'sub_categories.json',
+        'courses': 'courses_list.json',
+        'course_details': 'course_details.jsonl'
+    }
+
     def __init__(self, base_url="https://fastcampus.co.kr/", 
                  output_dir="./incremental_crawl"):
         """증분 크롤러 초기화."""
         self.base_url = base_url
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.json_dir = self.output_dir / "json_files"
+        self.log_dir = self.output_dir / "incremental_logs"
+        self.log = self._setup_logger()
 
         # 현재 크롤링 데이터
         self.current_data = {
@@ -103,6 +161,10 @@ class IncrementalCrawler:
             'course_details': []
         }
 
+        # 이전/현재 데이터의 URL -> 콘텐츠 해시 인덱스
+        self.previous_hashes = {data_type: {} for data_type in self.HASH_INDEX_TYPES}
+        self.current_hashes = {data_type: {} for data_type in self.HASH_INDEX_TYPES}
+
         # 증분 크롤링 통계
         self.incremental_stats = {
             'main_categories': {'new': 0, 'updated': 0, 'removed': 0, 'unchanged': 0},
@@ -111,12 +173,37 @@ class IncrementalCrawler:
             'course_details': {'new': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
         }
 
+        # 방문 URL은 8바이트 해시(int)로만 보관
         self.seen_urls = set()
+        self._seen_lock = threading.Lock()
         self.current_step = 0
         self.start_time = None
         self.course_titles = {}
         self.is_first_run = False
 
+        # 강의 페이지별 HTTP 캐시 검증값 (URL -> ETag/Last-Modified)
+        self.http_cache = {}
+        self._saved_http_cache = {}
+        self._previous_details = {}
+
+        # 크롤링 전체에서 공유하는 스레드 풀과 워커 스레드별 브라우저
+        self.executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS,
+                                           thread_name_prefix='fcam-worker')
+        self._thread_local = threading.local()
+        # 파일 저장 전용 스레드 풀
+        self._io_executor = ThreadPoolExecutor(max_workers=4,
+                                              thread_name_prefix='fcam-io')
+        self._io_futures = []
+
+        # 요청 간 연결을 재사용하는 HTTP 세션
+        self.http = requests.Session()
+        self.http.headers.update(self.HEADERS['default'])
+        adapter = HTTPAdapter(pool_connections=self.MAX_WORKERS,
+                              pool_maxsize=self.MAX_CONCURRENT_COURSES * 2,
+                              max_retries=3)
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+
         # 진행률 추적
         self.progress = {
             'total_subcategories': 0,
@@ -140,39 +227,51 @@ class IncrementalCrawler:
         for directory in directories:
             (self.output_dir / directory).mkdir(exist_ok=True)
 
-    def _log_progress(self, message, step=None):
+    def _setup_logger(self):
+        """로거 설정 (출력은 백그라운드 리스너 스레드에서 처리)."""
+        logger = logging.getLogger('fcam.incremental')
+        self._log_listener = None
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter(
+                "[%(asctime)s] [%(step)s] %(message)s", datefmt="%H:%M:%S"))
+            # 워커 스레드는 큐에 넣기만 하고 출력/flush는 리스너가 담당
+            log_queue = queue.SimpleQueue()
+            self._log_listener = QueueListener(log_queue, handler)
+            self._log_listener.start()
+            logger.addHandler(QueueHandler(log_queue))
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+        return logger
+
+    def _log_progress(self, message, *args, step=None):
         """진행 상황 로깅."""
         if step is not None:
             self.current_step = step
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
         step_name = (self.CRAWLING_STEPS[self.current_step] 
                     if self.current_step < len(self.CRAWLING_STEPS) 
                     else "알 수 없음")
-
-        print(f"[{timestamp}] [{step_name}] {message}")
-        sys.stdout.flush()
+        self.log.info(message, *args, extra={'step': step_name})
 
     def _log_step_start(self, step_name):
         """단계 시작 로깅."""
         self.current_step = self.CRAWLING_STEPS.index(step_name)
-        self._log_progress(f"{step_name} 시작")
+        self._log_progress("%s 시작", step_name)
 
     def _log_step_complete(self, step_name, count=None):
         """단계 완료 로깅."""
         if count is not None:
-            self._log_progress(f"{step_name} 완료 - {count}개 항목 수집")
+            self._log_progress("%s 완료 - %s개 항목 수집", step_name, count)
         else:
-            self._log_progress(f"{step_name} 완료")
+            self._log_progress("%s 완료", step_name)
 
-    def _log_error(self, message, error=None):
+    def _log_error(self, message, *args, error=None):
         """에러 로깅."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
         if error:
-            print(f"[{timestamp}] [ERROR] {message}: {str(error)}")
+            self.log.error(message + ": %s", *args, error, extra={'step': 'ERROR'})
         else:
-            print(f"[{timestamp}] [ERROR] {message}")
-        sys.stdout.flush()
+            self.log.error(message, *args, extra={'step': 'ERROR'})
 
     def _log_incremental_stats(self):
         """증분 크롤링 통계 로깅."""
@@ -181,85 +280,165 @@ class IncrementalCrawler:
         for data_type, stats in self.incremental_stats.items():
             total = sum(stats.values())
             if total > 0:
-                self._log_progress(f"{data_type}: 신규 {stats['new']}개, "
-                                 f"업데이트 {stats['updated']}개, "
-                                 f"삭제 {stats['removed']}개, "
-                                 f"변경없음 {stats['unchanged']}개")
+                self._log_progress("%s: 신규 %d개, 업데이트 %d개, 삭제 %d개, 변경없음 %d개",
+                                   data_type, stats['new'], stats['updated'],
+                                   stats['removed'], stats['unchanged'])
+
+    def _mark_seen(self, url):
+        """URL 방문 표시 (처음 본 URL이면 True, 스레드 안전)."""
+        key = int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), 'big')
+        with self._seen_lock:
+            if key in self.seen_urls:
+                return False
+            self.seen_urls.add(key)
+            return True
 
     def _generate_content_hash(self, content):
         """콘텐츠의 해시값 생성."""
         if isinstance(content, dict):
-            content = json.dumps(content, sort_keys=True, ensure_ascii=False)
-        return hashlib.md5(str(content).encode()).hexdigest()
+            content = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+        else:
+            content = str(content).encode()
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def _content_hashes(self, items):
+        """강의 링크 -> 콘텐츠 해시 인덱스 생성."""
+        return {link: self._generate_content_hash(item)
+                for item in items if (link := item.get('강의링크'))}
+
+    def _current_hashes(self, data_type, items):
+        """이번 실행 항목의 해시 인덱스 (비교 단계에서 계산한 해시는 재사용)."""
+        known = self.current_hashes[data_type]
+        return {link: known.get(link) or self._generate_content_hash(item)
+                for item in items if (link := item.get('강의링크'))}
+
+    def _hash_index_path(self, filename):
+        """데이터 파일에 대응하는 해시 인덱스 파일 경로."""
+        return (self.json_dir / filename).with_suffix('.hash.json')
+
+    def _load_previous_hashes(self, data_type, filename):
+        """이전 데이터의 해시 인덱스 로드 (없거나 맞지 않으면 다시 계산)."""
+        previous_items = self.previous_data[data_type]
+        index_path = self._hash_index_path(filename)
+
+        if index_path.exists():
+            try:
+                hashes = orjson.loads(index_path.read_bytes())
+                if hashes.keys() == {link for item in previous_items
+                                     if (link := item.get('강의링크'))}:
+                    return hashes
+            except Exception as e:
+                self._log_error("%s 해시 인덱스 로드 실패", data_type, error=e)
+
+        return self._content_hashes(previous_items)
 
     def _load_previous_data(self):
         """이전 크롤링 데이터 로드."""
         self._log_step_start("이전 데이터 로드")
         
-        data_files = {
-            'main_categories': 'main_categories.json',
-            'sub_categories': 'sub_categories.json',
-            'courses': 'courses_list.json',
-            'course_details': 'course_details.json'
-        }
-
-        for data_type, filename in data_files.items():
-            file_path = self.output_dir / "json_files" / filename
+        for data_type, filename in self.DATA_FILES.items():
+            file_path = self.json_dir / filename
+            if file_path.suffix == '.jsonl' and not file_path.exists():
+                # 이전 버전의 JSON 배열 파일
+                file_path = file_path.with_suffix('.json')
             
             if file_path.exists():
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.previous_data[data_type] = json.load(f)
-                    self._log_progress(f"{data_type} 이전 데이터 로드 완료: "
-                                     f"{len(self.previous_data[data_type])}개")
+                    if file_path.suffix == '.jsonl':
+                        self.previous_data[data_type] = self._read_jsonl(file_path)
+                    else:
+                        self.previous_data[data_type] = orjson.loads(
+                            file_path.read_bytes())
+                    self._log_progress("%s 이전 데이터 로드 완료: %d개", data_type,
+                                       len(self.previous_data[data_type]))
                 except Exception as e:
-                    self._log_error(f"{data_type} 이전 데이터 로드 실패", e)
+                    self._log_error("%s 이전 데이터 로드 실패", data_type, error=e)
                     self.previous_data[data_type] = []
             else:
-                self._log_progress(f"{data_type} 이전 데이터 없음 (첫 실행)")
+                self._log_progress("%s 이전 데이터 없음 (첫 실행)", data_type)
                 self.previous_data[data_type] = []
                 self.is_first_run = True
 
+            if data_type in self.HASH_INDEX_TYPES:
+                self.previous_hashes[data_type] = self._load_previous_hashes(
+                    data_type, filename)
+
+        http_cache_path = self.json_dir / "http_cache.json"
+        if http_cache_path.exists():
+            try:
+                self.http_cache = orjson.loads(http_cache_path.read_bytes())
+            except Exception as e:
+                self._log_error("HTTP 캐시 로드 실패", error=e)
+        # 검증값은 항목 단위로 교체되므로 얕은 복사로 변경 여부 판단 가능
+        self._saved_http_cache = dict(self.http_cache)
+
         self._log_step_complete("이전 데이터 로드")
 
+    def _read_jsonl(self, file_path):
+        """JSON Lines 파일 로드 (같은 강의 링크는 마지막 레코드만 유지)."""
+        records = {}
+        with open(file_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    record = orjson.loads(line)
+                    records[record.get('강의링크', '')] = record
+        return list(records.values())
+
+    def _append_jsonl(self, file_path, records):
+        """레코드를 한 줄에 하나씩 JSON Lines 파일에 추가."""
+        with open(file_path, 'ab') as f:
+            f.write(b''.join(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+                             for record in records))
+
+    def _write_json_array(self, file_path, items, indent=True):
+        """JSON 배열을 항목 단위로 스트리밍 저장 (저장한 항목 수 반환)."""
+        count = 0
+        # 항목마다 두 번씩 write하므로 큰 버퍼로 시스템 호출 수를 줄임
+        with open(file_path, 'wb', buffering=1 << 16) as f:
+            if not indent:
+                # 들여쓰기 없이 한 줄로 저장
+                for item in items:
+                    f.write(b'[' if count == 0 else b',')
+                    f.write(orjson.dumps(item))
+                    count += 1
+                f.write(b']' if count else b'[]')
+                return count
+
+            for item in items:
+                # 배열 안의 항목이므로 각 줄을 한 단계 더 들여쓰기
+                f.write(b'[\n  ' if count == 0 else b',\n  ')
+                f.write(orjson.dumps(item, option=orjson.OPT_INDENT_2)
+                        .replace(b'\n', b'\n  '))
+                count += 1
+            f.write(b'\n]' if count else b'[]')
+        return count
+
     def _compare_data_changes(self, data_type, current_data, previous_data):
         """데이터 변경사항 비교."""
-        current_urls = set()
-        previous_urls = set()
-        
-        # URL 기반 비교를 위한 데이터 준비
-        if data_type in ['main_categories', 'sub_categories']:
-            current_urls = set(item.get('메인카테고리링크', item.get('하위카테고리링크', '')) 
-                             for item in current_data)
-            previous_urls = set(item.get('메인카테고리링크', item.get('하위카테고리링크', '')) 
-                              for item in previous_data)
-        elif data_type == 'courses':
-            current_urls = set(item.get('강의링크', '') for item in current_data)
-            previous_urls = set(item.get('강의링크', '') for item in previous_data)
-        elif data_type == 'course_details':
-            current_urls = set(item.get('강의링크', '') for item in current_data)
-            previous_urls = set(item.get('강의링크', '') for item in previous_data)
+        # URL 기반 비교 (링크가 없는 항목은 비교 대상에서 제외)
+        updated_items = set()
+        if data_type in self.HASH_INDEX_TYPES:
+            # 이전 해시는 저장된 인덱스를 사용하므로 현재 데이터만 해싱하고,
+            # 해시 인덱스의 키를 그대로 URL 집합으로 사용
+            current_hashes = self._content_hashes(current_data)
+            previous_hashes = self.previous_hashes[data_type]
+            self.current_hashes[data_type] = current_hashes
+            current_urls = current_hashes.keys()
+            previous_urls = previous_hashes.keys()
+
+            # 업데이트된 항목 찾기 (URL은 같지만 내용이 다른 경우)
+            updated_items = {url for url in current_urls & previous_urls
+                             if current_hashes[url] != previous_hashes[url]}
+        else:
+            key = self.URL_KEYS[data_type]
+            current_urls = {item[key] for item in current_data if item.get(key)}
+            previous_urls = {item[key] for item in previous_data if item.get(key)}
 
         # 변경사항 분류
         new_items = current_urls - previous_urls
         removed_items = previous_urls - current_urls
         unchanged_items = current_urls & previous_urls
 
-        # 업데이트된 항목 찾기 (URL은 같지만 내용이 다른 경우)
-        updated_items = set()
-        if data_type in ['courses', 'course_details']:
-            for item in current_data:
-                url = item.get('강의링크', '')
-                if url in unchanged_items:
-                    # 이전 데이터에서 같은 URL의 항목 찾기
-                    previous_item = next((p for p in previous_data 
-                                        if p.get('강의링크', '') == url), None)
-                    if previous_item:
-                        current_hash = self._generate_content_hash(item)
-                        previous_hash = self._generate_content_hash(previous_item)
-                        if current_hash != previous_hash:
-                            updated_items.add(url)
-
         # 통계 업데이트
         self.incremental_stats[data_type] = {
             'new': len(new_items),
@@ -278,15 +457,80 @@ class IncrementalCrawler:
     def _setup_browser(self, playwright):
         """브라우저 설정."""
         browser = playwright.chromium.launch(headless=True)
+        _, page = self._new_page(browser)
+        return browser, page
+
+    def _new_page(self, browser):
+        """새 브라우저 컨텍스트와 페이지 생성."""
         context = browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent=self.HEADERS['default']['User-Agent'],
             extra_http_headers=self.HEADERS['default']
         )
+        # 같은 컨텍스트에서 여는 페이지는 모두 이 기본값을 따름
+        context.set_default_timeout(self.TIMEOUTS['default'])
+        context.set_default_navigation_timeout(self.TIMEOUTS['navigation'])
         page = context.new_page()
-        page.set_default_timeout(self.TIMEOUTS['default'])
-        page.set_default_navigation_timeout(self.TIMEOUTS['navigation'])
-        return browser, page
+        return context, page
+
+    @contextmanager
+    def _worker_page(self):
+        """워커 스레드 전용 브라우저에서 작업용 페이지 생성.
+
+        브라우저와 컨텍스트는 스레드마다 한 번만 만들어 쿠키와 HTTP 캐시를
+        작업 간에 공유하고, 작업마다 페이지만 새로 연다.
+        """
+        if getattr(self._thread_local, 'browser', None) is None:
+            self._thread_local.playwright = sync_playwright().start()
+            self._thread_local.browser = (
+                self._thread_local.playwright.chromium.launch(headless=True))
+            self._thread_local.context, page = self._new_page(
+                self._thread_local.browser)
+        else:
+            page = self._thread_local.context.new_page()
+
+        try:
+            yield page
+        finally:
+            page.close()
+
+    def _close_worker_browser(self, barrier):
+        """현재 워커 스레드의 브라우저 종료."""
+        # 모든 워커 스레드가 이 작업을 하나씩 맡도록 대기
+        try:
+            barrier.wait(timeout=60)
+        except threading.BrokenBarrierError:
+            pass
+
+        browser = getattr(self._thread_local, 'browser', None)
+        if browser is not None:
+            browser.close()
+            self._thread_local.playwright.stop()
+            self._thread_local.browser = None
+            self._thread_local.context = None
+
+    def close(self):
+        """워커 브라우저, 스레드 풀, HTTP 세션 및 로그 리스너 종료."""
+        # sync Playwright 객체는 만든 스레드에서만 닫을 수 있음
+        barrier = threading.Barrier(self.MAX_WORKERS)
+        futures = [self.executor.submit(self._close_worker_browser, barrier)
+                   for _ in range(self.MAX_WORKERS)]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                self._log_error("워커 브라우저 종료 실패", error=e)
+
+        self.executor.shutdown(wait=True)
+        self._wait_for_io()
+        self._io_executor.shutdown(wait=True)
+
+        # 큐에 남은 로그를 모두 출력한 뒤 리스너 종료
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self.log.handlers.clear()
+            self._log_listener = None
+        self.http.close()
 
     def _safe_page_load(self, page, url, retries=3):
         """안전한 페이지 로딩."""
@@ -300,32 +544,33 @@ class IncrementalCrawler:
                     page.wait_for_timeout(3000)
         return False
 
-    def _scroll_page(self, page):
-        """동적 콘텐츠 로드를 위한 스크롤."""
-        last_height = page.evaluate("document.body.scrollHeight")
-
-        while True:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
-            new_height = page.evaluate("document.body.scrollHeight")
-
-            if new_height == last_height:
-                break
-            last_height = new_height
+    def _scroll_page(self, page, idle_timeout=2000):
+        """동적 콘텐츠 로드를 위한 스크롤 (브라우저 내부에서 한 번에 실행)."""
+        page.evaluate("""
+            async (idleTimeout) => {
+                const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+                let lastHeight = document.body.scrollHeight;
+
+                while (true) {
+                    window.scrollTo(0, document.body.scrollHeight);
+
+                    // 높이가 늘어나면 즉시 다음 스크롤, 변화가 없으면 종료
+                    const start = Date.now();
+                    while (document.body.scrollHeight === lastHeight 
+                           && Date.now() - start < idleTimeout) {
+                        await sleep(100);
+                    }
+                    if (document.body.scrollHeight === lastHeight) {
+                        break;
+                    }
+                    lastHeight = document.body.scrollHeight;
+                }
+            }
+        """, idle_timeout)
 
     def _wait_for_images_to_load(self, page, timeout=30000):
         """이미지 완전 로딩 대기."""
         try:
-            # 모든 이미지가 로드될 때까지 대기
-            page.wait_for_function("""
-                () => {
-                    const images = Array.from(document.querySelectorAll('img'));
-                    return images.every(img => {
-                        return img.complete && img.naturalHeight !== 0;
-                    });
-                }
-            """, timeout=timeout)
-
             # lazy loading 이미지들 강제 로드
             page.evaluate("""
                 () => {
@@ -338,6 +583,16 @@ class IncrementalCrawler:
                 }
             """)
 
+            # 모든 이미지 디코딩 완료 대기 (폴링 없이 한 번의 호출로 대기,
+            # 깨진 이미지는 실패 즉시 완료로 처리)
+            page.evaluate("""
+                (timeout) => Promise.race([
+                    Promise.all(Array.from(document.images).map(
+                        img => img.decode().catch(() => null))),
+                    new Promise(resolve => setTimeout(resolve, timeout))
+                ])
+            """, timeout)
+
             # srcset 속성 정규화
             page.evaluate("""
                 () => {
@@ -363,7 +618,7 @@ class IncrementalCrawler:
             return True
 
         except Exception as e:
-            self._log_error(f"이미지 로딩 대기 중 오류", e)
+            self._log_error("이미지 로딩 대기 중 오류", error=e)
             return False
 
     def _prepare_navigation(self, page):
@@ -399,7 +654,7 @@ class IncrementalCrawler:
                         button.click(timeout=10000)
                         page.wait_for_timeout(3000)
                         clicked = True
-                        self._log_progress(f"카테고리 버튼 클릭 성공: {selector}")
+                        self._log_progress("카테고리 버튼 클릭 성공: %s", selector)
                         break
                 except Exception:
                     continue
@@ -408,7 +663,7 @@ class IncrementalCrawler:
                 self._log_error("모든 카테고리 버튼 선택자 실패")
 
         except Exception as e:
-            self._log_error(f"네비게이션 준비 실패", e)
+            self._log_error("네비게이션 준비 실패", error=e)
 
     def _extract_main_categories(self, page):
         """메인 카테고리 추출."""
@@ -416,6 +671,7 @@ class IncrementalCrawler:
         self._prepare_navigation(page)
         links = page.locator(self.SELECTORS['main_category']).all()
         seen = set()
+        collected_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         for i, link in enumerate(links, 1):
             try:
@@ -432,10 +688,10 @@ class IncrementalCrawler:
                     self.current_data['main_categories'].append({
                         "메인카테고리": name,
                         "메인카테고리링크": url,
-                        "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        "수집일시": collected_at
                     })
             except Exception as e:
-                self._log_error(f"메인 카테고리 처리 중 오류 (링크 {i})", e)
+                self._log_error("메인 카테고리 처리 중 오류 (링크 %s)", i, error=e)
                 continue
 
         # 변경사항 비교
@@ -444,61 +700,53 @@ class IncrementalCrawler:
                                            self.previous_data['main_categories'])
 
         if changes['new'] or changes['updated'] or changes['removed']:
-            self._log_progress(f"메인 카테고리 변경사항 발견: "
-                             f"신규 {len(changes['new'])}개, "
-                             f"업데이트 {len(changes['updated'])}개, "
-                             f"삭제 {len(changes['removed'])}개")
+            self._log_progress("메인 카테고리 변경사항 발견: 신규 %d개, 업데이트 %d개, 삭제 %d개",
+                               len(changes['new']), len(changes['updated']),
+                               len(changes['removed']))
         else:
             self._log_progress("메인 카테고리 변경사항 없음")
 
         self._log_step_complete("메인 카테고리 확인", 
                                len(self.current_data['main_categories']))
 
-    def _find_parent_category(self, sub_link):
-        """상위 카테고리 찾기."""
-        try:
-            xpath = ('xpath=ancestor::div[contains(@class, '
-                    '"GNBDesktopCategoryItem_container__ln5E6")]')
-            parent = sub_link.locator(xpath).first
-
-            if parent.count() > 0:
-                main_link = parent.locator('a[href*="category_online"]').first
-                if main_link.count() > 0:
-                    return main_link.text_content().strip()
-        except Exception:
-            pass
-        return None
-
     def _extract_sub_categories(self, page):
         """하위 카테고리 추출."""
         self._log_step_start("하위 카테고리 확인")
         self._prepare_navigation(page)
-        links = page.locator(self.SELECTORS['sub_category']).all()
-
-        for i, link in enumerate(links, 1):
-            try:
-                name = link.text_content().strip()
-                url = link.get_attribute('href')
+        collected_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # 하위 카테고리 링크와 상위 카테고리 이름을 한 번의 호출로 수집
+        links = page.evaluate("""
+            ([subSelector, containerSelector]) => Array.from(
+                document.querySelectorAll(subSelector), link => {
+                    const container = link.closest(containerSelector);
+                    const mainLink = container 
+                        ? container.querySelector('a[href*="category_online"]') 
+                        : null;
+                    return {
+                        name: (link.textContent || '').trim(),
+                        url: link.getAttribute('href'),
+                        parent: mainLink ? (mainLink.textContent || '').trim() : null
+                    };
+                })
+        """, [self.SELECTORS['sub_category'],
+              'div.GNBDesktopCategoryItem_container__ln5E6'])
+
+        for link in links:
+            name, url, parent = link['name'], link['url'], link['parent']
+            if not name or not url or not self._mark_seen(url):
+                continue
 
-                if not name or not url or url in self.seen_urls:
-                    continue
+            if parent:
+                if url.startswith('/'):
+                    url = urljoin(self.base_url, url)
 
-                self.seen_urls.add(url)
-                parent = self._find_parent_category(link)
-
-                if parent:
-                    if url.startswith('/'):
-                        url = urljoin(self.base_url, url)
-
-                    self.current_data['sub_categories'].append({
-                        "메인카테고리": parent,
-                        "하위카테고리": name,
-                        "하위카테고리링크": url,
-                        "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
-            except Exception as e:
-                self._log_error(f"하위 카테고리 처리 중 오류 (링크 {i})", e)
-                continue
+                self.current_data['sub_categories'].append({
+                    "메인카테고리": parent,
+                    "하위카테고리": name,
+                    "하위카테고리링크": url,
+                    "수집일시": collected_at
+                })
 
         # 변경사항 비교
         changes = self._compare_data_changes('sub_categories',
@@ -506,13 +754,14 @@ class IncrementalCrawler:
                                            self.previous_data['sub_categories'])
 
         if changes['new']:
-            self._log_progress(f"신규 하위 카테고리 {len(changes['new'])}개 발견")
+            self._log_progress("신규 하위 카테고리 %s개 발견", len(changes['new']))
+            categories_by_url = {cat.get('하위카테고리링크'): cat 
+                                 for cat in self.current_data['sub_categories']}
             for new_url in changes['new']:
-                new_category = next((cat for cat in self.current_data['sub_categories']
-                                   if cat.get('하위카테고리링크') == new_url), None)
+                new_category = categories_by_url.get(new_url)
                 if new_category:
-                    self._log_progress(f"  - {new_category['메인카테고리']} > "
-                                     f"{new_category['하위카테고리']}")
+                    self._log_progress("  - %s > %s", new_category['메인카테고리'],
+                                       new_category['하위카테고리'])
 
         self.progress['total_subcategories'] = len(self.current_data['sub_categories'])
         self._log_step_complete("하위 카테고리 확인", 
@@ -523,36 +772,33 @@ class IncrementalCrawler:
         self._log_step_start("강의 목록 확인")
         
         # 신규 하위 카테고리에서 강의 수집
-        new_subcategories = []
-        for category in self.current_data['sub_categories']:
-            url = category['하위카테고리링크']
-            if not any(p.get('하위카테고리링크') == url 
-                      for p in self.previous_data['sub_categories']):
-                new_subcategories.append(category)
+        previous_urls = self._previous_subcategory_urls()
+        new_subcategories = [category for category in self.current_data['sub_categories']
+                             if category['하위카테고리링크'] not in previous_urls]
 
         if new_subcategories:
-            self._log_progress(f"신규 하위 카테고리 {len(new_subcategories)}개에서 "
-                             f"강의 수집 시작")
+            self._log_progress("신규 하위 카테고리 %d개에서 강의 수집 시작",
+                               len(new_subcategories))
             
-            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-                futures = []
-                for subcategory in new_subcategories:
-                    future = executor.submit(
-                        self._extract_courses_from_subcategory, 
-                        subcategory, 
-                        max_courses=20
-                    )
-                    futures.append(future)
-
-                for i, future in enumerate(futures):
-                    try:
-                        courses = future.result(timeout=300)
-                        if courses:
-                            self.current_data['courses'].extend(courses)
-                            self._log_progress(f"신규 카테고리 강의 수집 완료: "
-                                             f"{len(courses)}개")
-                    except Exception as e:
-                        self._log_error(f"신규 카테고리 강의 수집 실패: {i+1}", e)
+            futures = {}
+            for i, subcategory in enumerate(new_subcategories, 1):
+                future = self.executor.submit(
+                    self._extract_courses_from_subcategory, 
+                    subcategory, 
+                    max_courses=20
+                )
+                futures[future] = i
+
+            # 완료되는 순서대로 결과 수집
+            for future in as_completed(futures):
+                try:
+                    courses = future.result()
+                    if courses:
+                        self.current_data['courses'].extend(courses)
+                        self._log_progress("신규 카테고리 강의 수집 완료: %d개",
+                                           len(courses))
+                except Exception as e:
+                    self._log_error("신규 카테고리 강의 수집 실패: %s", futures[future], error=e)
 
         # 기존 카테고리에서 강의 목록만 빠르게 확인
         self._check_existing_courses()
@@ -563,147 +809,139 @@ class IncrementalCrawler:
                                            self.previous_data['courses'])
 
         if changes['new']:
-            self._log_progress(f"신규 강의 {len(changes['new'])}개 발견")
+            self._log_progress("신규 강의 %s개 발견", len(changes['new']))
         if changes['updated']:
-            self._log_progress(f"업데이트된 강의 {len(changes['updated'])}개 발견")
+            self._log_progress("업데이트된 강의 %s개 발견", len(changes['updated']))
 
         self._log_step_complete("강의 목록 확인", len(self.current_data['courses']))
 
+    def _previous_subcategory_urls(self):
+        """이전 하위 카테고리 링크 집합."""
+        return {p.get('하위카테고리링크') for p in self.previous_data['sub_categories']}
+
     def _check_existing_courses(self):
         """기존 카테고리에서 강의 목록 빠른 확인."""
         # 기존 하위 카테고리에서 강의 목록만 빠르게 확인
-        existing_categories = []
-        for category in self.current_data['sub_categories']:
-            url = category['하위카테고리링크']
-            if any(p.get('하위카테고리링크') == url 
-                  for p in self.previous_data['sub_categories']):
-                existing_categories.append(category)
+        previous_urls = self._previous_subcategory_urls()
+        existing_categories = [category for category in self.current_data['sub_categories']
+                               if category['하위카테고리링크'] in previous_urls]
 
         if existing_categories:
-            self._log_progress(f"기존 카테고리 {len(existing_categories)}개에서 "
-                             f"강의 목록 빠른 확인")
+            self._log_progress("기존 카테고리 %d개에서 강의 목록 빠른 확인",
+                               len(existing_categories))
             
             # 샘플링으로 일부 카테고리만 확인 (성능 최적화)
             sample_size = min(5, len(existing_categories))
             sample_categories = existing_categories[:sample_size]
             
-            for category in sample_categories:
+            futures = [self.executor.submit(self._count_category_courses, category)
+                       for category in sample_categories]
+
+            for category, future in zip(sample_categories, futures):
                 try:
-                    with sync_playwright() as p:
-                        browser, page = self._setup_browser(p)
-                        
-                        if self._safe_page_load(page, category['하위카테고리링크']):
-                            self._scroll_page(page)
-                            page.wait_for_timeout(2000)
-                            
-                            # 강의 카드 개수만 빠르게 확인
-                            cards = page.locator(self.SELECTORS['course_card']).all()
-                            self._log_progress(f"카테고리 '{category['하위카테고리']}': "
-                                             f"{len(cards)}개 강의 확인")
-                        
-                        browser.close()
+                    count = future.result(timeout=300)
+                    if count is not None:
+                        self._log_progress("카테고리 '%s': %d개 강의 확인",
+                                           category['하위카테고리'], count)
                 except Exception as e:
-                    self._log_error(f"카테고리 확인 실패: {category['하위카테고리']}", e)
+                    self._log_error("카테고리 확인 실패: %s", category['하위카테고리'], error=e)
 
-    def _extract_courses_from_subcategory(self, subcategory, max_courses=20):
-        """하위 카테고리에서 강의 정보 추출."""
-        with sync_playwright() as p:
-            browser, page = self._setup_browser(p)
-
-            try:
-                if not self._safe_page_load(page, subcategory['하위카테고리링크']):
-                    return []
-
-                self._scroll_page(page)
-                page.wait_for_timeout(3000)
-
-                # 강의 카드 찾기
-                card_selectors = [
-                    '[data-e2e="course-card"]',
-                    '.course-card', 
-                    '.course-item',
-                    'div[class*="CourseCard"]'
-                ]
-
-                cards = []
-                for selector in card_selectors:
-                    found_cards = page.locator(selector).all()
-                    if found_cards:
-                        cards = found_cards
-                        break
-
-                if not cards:
-                    cards = page.locator(self.SELECTORS['course_link']).all()
-
-                collected_courses = []
-                for i, card in enumerate(cards[:max_courses], 1):
-                    try:
-                        url = self._extract_course_url(card)
-                        if not url:
-                            continue
+    def _count_category_courses(self, category):
+        """카테고리 페이지의 강의 카드 개수 확인 (병렬 처리용)."""
+        with self._worker_page() as page:
+            if not self._safe_page_load(page, category['하위카테고리링크']):
+                return None
 
-                        if url.startswith('/'):
-                            url = urljoin(self.base_url, url)
+            self._scroll_page(page)
+            page.wait_for_timeout(2000)
 
-                        if '/event_online_' in url or url in self.seen_urls:
-                            continue
+            # 강의 카드 개수만 빠르게 확인
+            return page.locator(self.SELECTORS['course_card']).count()
 
-                        self.seen_urls.add(url)
-                        title = self._extract_title(card, url)
+    def _extract_courses_from_subcategory(self, subcategory, max_courses=20):
+        """하위 카테고리에서 강의 정보 추출."""
+        with self._worker_page() as page:
+            if not self._safe_page_load(page, subcategory['하위카테고리링크']):
+                return []
+
+            self._scroll_page(page)
+            page.wait_for_timeout(3000)
+
+            # 강의 카드 찾기
+            card_selectors = [
+                '[data-e2e="course-card"]',
+                '.course-card', 
+                '.course-item',
+                'div[class*="CourseCard"]'
+            ]
 
-                        course_data = {
-                            "메인카테고리": subcategory['메인카테고리'],
-                            "하위카테고리": subcategory['하위카테고리'],
-                            "강의제목": title,
-                            "강의링크": url,
-                            "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # 카드 탐색과 링크/제목 추출을 한 번의 호출로 처리
+            cards = page.evaluate("""
+                ([cardSelectors, linkSelector, titleSelectors, maxCourses]) => {
+                    let cards = [];
+                    for (const selector of cardSelectors) {
+                        cards = Array.from(document.querySelectorAll(selector));
+                        if (cards.length) {
+                            break;
+                        }
+                    }
+                    if (!cards.length) {
+                        cards = Array.from(document.querySelectorAll(linkSelector));
+                    }
+
+                    const isValid = (text) => text.length > 3 
+                        && !/^\\d+$/.test(text) && !text.endsWith('+');
+
+                    return cards.slice(0, maxCourses).map(card => {
+                        let url = card.getAttribute('href');
+                        if (!url) {
+                            const link = card.querySelector(linkSelector);
+                            url = link ? link.getAttribute('href') : null;
                         }
 
-                        collected_courses.append(course_data)
-                    except Exception as e:
-                        continue
-
-                return collected_courses
-
-            finally:
-                browser.close()
-
-    def _extract_course_url(self, card):
-        """강의 URL 추출."""
-        try:
-            url = card.get_attribute('href')
-            if url:
-                return url
-        except Exception:
-            pass
+                        let title = null;
+                        for (const selector of titleSelectors) {
+                            const element = card.querySelector(selector);
+                            const text = element ? (element.textContent || '').trim() : '';
+                            if (isValid(text)) {
+                                title = text;
+                                break;
+                            }
+                        }
+                        return {url, title};
+                    });
+                }
+            """, [card_selectors, self.SELECTORS['course_link'],
+                  self.TITLE_SELECTORS, max_courses])
+
+            collected_courses = []
+            collected_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # 카드마다 같은 카테고리 값은 한 번만 조회
+            category_fields = {
+                "메인카테고리": subcategory['메인카테고리'],
+                "하위카테고리": subcategory['하위카테고리']
+            }
+            for card in cards:
+                url = card['url']
+                if not url:
+                    continue
 
-        try:
-            link = card.locator(self.SELECTORS['course_link']).first
-            if link.count() > 0:
-                return link.get_attribute('href')
-        except Exception:
-            pass
+                if url.startswith('/'):
+                    url = urljoin(self.base_url, url)
 
-        return None
+                if '/event_online_' in url or not self._mark_seen(url):
+                    continue
 
-    def _extract_title(self, card, course_url=None):
-        """강의 제목 추출."""
-        selectors = [
-            '.CourseCard_courseCardTitle__1HQgO',
-            '[data-e2e="display-card"]',
-            'h3', 'h4', '.course-title', '.title', 
-            '[data-e2e="course-title"]', '.course-name'
-        ]
+                course_data = {
+                    **category_fields,
+                    "강의제목": card['title'] or "제목 없음",
+                    "강의링크": url,
+                    "수집일시": collected_at
+                }
 
-        for selector in selectors:
-            element = card.locator(selector).first
-            if element.count() > 0:
-                title = element.text_content().strip()
-                if (title and len(title) > 3 and not title.isdigit() 
-                    and not title.endswith('+')):
-                    return title
+                collected_courses.append(course_data)
 
-        return "제목 없음"
+            return collected_courses
 
     def _collect_course_details_incremental(self):
         """증분 강의 상세 정보 수집."""
@@ -730,123 +968,251 @@ class IncrementalCrawler:
             self._log_step_complete("강의 상세 정보 수집")
             return
 
-        self._log_progress(f"신규/업데이트 강의 {len(target_courses)}개 상세 수집 시작")
-
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-            futures = []
-            for course in target_courses:
-                future = executor.submit(
-                    self._extract_course_detail, 
-                    course['강의링크']
-                )
-                futures.append(future)
-
-            for i, future in enumerate(futures):
-                try:
-                    detail = future.result(timeout=300)
-                    if detail:
-                        self.current_data['course_details'].append(detail)
-                        if (i + 1) % 5 == 0:
-                            self._log_progress(f"강의 상세 완료: {i+1}/{len(futures)}")
-                except Exception as e:
-                    self._log_error(f"강의 상세 처리 실패: {i+1}", e)
+        self._log_progress("신규/업데이트 강의 %s개 상세 수집 시작", len(target_courses))
+
+        # 서버 기준으로 변경되지 않은 페이지는 이전 상세 정보를 재사용
+        self._previous_details = {link: item
+                                  for item in self.previous_data['course_details']
+                                  if (link := item.get('강의링크'))}
+        not_modified = 0
+
+        futures = {}
+        for i, course in enumerate(target_courses, 1):
+            future = self.executor.submit(
+                self._extract_course_detail, 
+                course['강의링크']
+            )
+            futures[future] = i
+
+        # 완료되는 순서대로 결과 수집
+        completed = 0
+        for future in as_completed(futures):
+            completed += 1
+            try:
+                detail = future.result()
+                course_url = target_courses[futures[future] - 1]['강의링크']
+                if detail is not None and detail is self._previous_details.get(course_url):
+                    not_modified += 1
+                elif detail:
+                    self.current_data['course_details'].append(detail)
+                    if completed % 5 == 0:
+                        self._log_progress("강의 상세 완료: %s/%s", completed, len(futures))
+            except Exception as e:
+                self._log_error("강의 상세 처리 실패: %s", futures[future], error=e)
 
+        self._wait_for_io()
+        if not_modified:
+            self._log_progress("변경 없는 강의 페이지 %s개 건너뜀", not_modified)
         self._log_step_complete("강의 상세 정보 수집", 
                               len(self.current_data['course_details']))
 
-    def _extract_course_detail(self, course_url):
-        """강의 상세 정보 추출."""
-        with sync_playwright() as p:
-            browser, page = self._setup_browser(p)
-
+    def _wait_for_io(self):
+        """백그라운드 파일 저장 완료 대기 및 실패 보고."""
+        futures, self._io_futures = self._io_futures, []
+        for future in futures:
             try:
-                course_name = course_url.split('/')[-1]
-
-                if not self._safe_page_load(page, course_url):
-                    return None
-
-                self._scroll_page(page)
-                page.wait_for_timeout(3000)
-
-                # HTML 저장
-                html_content = page.content()
-                safe_name = course_url.split('/')[-1]
-
-                with open(self.output_dir / f"courses/{safe_name}.html", 
-                          'w', encoding='utf-8') as f:
-                    f.write(html_content)
-
-                soup = BeautifulSoup(html_content, 'html.parser')
-
-                # 제목 추출
-                title_selectors = ['h1', '[data-e2e="course-title"]', '.title']
-                title = "제목 없음"
-
-                for selector in title_selectors:
-                    element = soup.select_one(selector)
-                    if element and element.get_text().strip():
-                        title = element.get_text().strip()
-                        if title != "root layout":
-                            break
+                future.result()
+            except Exception as e:
+                self._log_error("파일 저장 실패", error=e)
 
-                return {
-                    "강의명": title,
-                    "강의링크": course_url,
-                    "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "추출된_텍스트": self._extract_page_content(soup)
-                }
+    def _is_not_modified(self, course_url):
+        """HEAD 조건부 요청으로 강의 페이지 변경 여부와 새 검증값 확인."""
+        validators = self.http_cache.get(course_url, {})
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
 
-            finally:
-                browser.close()
+        try:
+            response = self.http.head(course_url, headers=headers, timeout=10,
+                                      allow_redirects=True)
+        except requests.RequestException:
+            return False, None
 
-    def _extract_page_content(self, soup):
-        """페이지 텍스트 콘텐츠 추출."""
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
+        if response.status_code == 304:
+            return True, None
 
-        main_content = soup.find('main') or soup.find('body') or soup
-        text = main_content.get_text()
+        if response.status_code == 200:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                return False, {'etag': etag, 'last_modified': last_modified}
+        return False, None
 
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        return '\n'.join(lines) if lines else "텍스트 없음"
+    def _extract_course_detail(self, course_url):
+        """강의 상세 정보 추출."""
+        # 검증값 기록을 위해 신규 강의도 HEAD 요청을 보냄
+        previous = self._previous_details.get(course_url)
+        not_modified, validators = self._is_not_modified(course_url)
+        if not_modified and previous is not None:
+            return previous
+
+        with self._worker_page() as page:
+            course_name = course_url.split('/')[-1]
+
+            if not self._safe_page_load(page, course_url):
+                return None
+
+            self._scroll_page(page)
+            page.wait_for_timeout(3000)
+
+            # HTML 저장은 I/O 스레드에 맡기고 파싱은 한 번만 수행
+            html_content = page.content()
+            safe_name = course_url.split('/')[-1]
+            self._io_futures.append(self._io_executor.submit(
+                (self.output_dir / f"courses/{safe_name}.html").write_text,
+                html_content, encoding='utf-8'))
+
+            tree = lxml_html.fromstring(html_content)
+            title = self._extract_course_title(tree)
+
+            detail = {
+                "강의명": title,
+                "강의링크": course_url,
+                "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "추출된_텍스트": self._extract_page_content(tree)
+            }
+
+        # 새 내용을 실제로 수집한 뒤에만 검증값 갱신 (수집 실패 시 304로 변경을 놓치지 않도록)
+        if validators:
+            self.http_cache[course_url] = validators
+        return detail
+
+    def _extract_course_title(self, tree):
+        """강의 상세 페이지 제목 추출."""
+        title = "제목 없음"
+        for xpath in self.TITLE_XPATHS:
+            elements = tree.xpath(xpath)
+            if elements and elements[0].text_content().strip():
+                title = elements[0].text_content().strip()
+                if title != "root layout":
+                    break
+        return title
+
+    def _extract_page_content(self, tree):
+        """페이지 텍스트 콘텐츠 추출 (트리에서 불필요한 요소를 제거함)."""
+        etree.strip_elements(tree, 'script', 'style', 'nav', 'footer', 'header',
+                             with_tail=False)
+
+        main_content = tree.find('.//main')
+        if main_content is None:
+            main_content = tree.find('.//body')
+        if main_content is None:
+            main_content = tree
+        text = main_content.text_content()
+
+        stripped = (line.strip() for line in text.split('\n'))
+        return '\n'.join(line for line in stripped if line) or "텍스트 없음"
 
     def _save_incremental_data(self):
         """증분 데이터 저장."""
         self._log_step_start("데이터 저장")
-        
-        # 기존 데이터와 병합
+
+        # 이번 실행에서 수집된 데이터가 전혀 없으면 기존 파일을 그대로 두고 로그만 기록
+        if not any(self.current_data[data_type] for data_type in self.DATA_FILES):
+            self._log_progress("수집된 데이터 없음 - 기존 파일 유지")
+            self._save_http_cache()
+            self._wait_for_io()
+            self._save_incremental_log()
+            self._log_step_complete("데이터 저장")
+            return
+
+        # 기존 데이터와 병합 (이전 파일과 내용이 같은 데이터 종류는 기록 생략)
         merged_data = {}
+        merged_hashes = {}
+        unchanged = set()
         for data_type in ['main_categories', 'sub_categories', 'courses', 'course_details']:
             if data_type == 'courses':
                 # 강의 데이터는 URL 기반으로 중복 제거
-                existing_urls = set(item.get('강의링크', '') 
-                                  for item in self.previous_data[data_type])
+                # (이전 해시 인덱스의 키가 곧 이전 강의 URL 집합)
+                existing_urls = self.previous_hashes[data_type].keys()
                 new_items = [item for item in self.current_data[data_type]
-                           if item.get('강의링크', '') not in existing_urls]
-                merged_data[data_type] = self.previous_data[data_type] + new_items
+                           if _course_link(item) not in existing_urls]
+                # 이어 붙인 리스트를 만들지 않고 파일에 바로 스트리밍
+                merged_data[data_type] = chain(self.previous_data[data_type], new_items)
+
+                # 이전 항목은 이전 해시를, 신규 항목은 현재 해시를 그대로 사용
+                merged_hashes[data_type] = dict(self.previous_hashes[data_type])
+                merged_hashes[data_type].update(
+                    self._current_hashes(data_type, new_items))
+                if not new_items:
+                    unchanged.add(data_type)
+            elif data_type == 'course_details':
+                # 강의 상세는 신규/업데이트분이 같은 링크의 이전 레코드를 대체
+                merged = {item.get('강의링크', ''): item
+                          for item in self.previous_data[data_type]}
+                current_items = self.current_data[data_type]
+                merged.update(zip(map(_course_link, current_items), current_items))
+                merged_data[data_type] = list(merged.values())
+
+                merged_hashes[data_type] = dict(self.previous_hashes[data_type])
+                merged_hashes[data_type].update(
+                    self._current_hashes(data_type, current_items))
+                if not current_items:
+                    unchanged.add(data_type)
             else:
                 # 다른 데이터는 현재 데이터로 교체
                 merged_data[data_type] = self.current_data[data_type]
-
-        # JSON 파일 저장
-        data_files = {
-            'main_categories': 'main_categories.json',
-            'sub_categories': 'sub_categories.json',
-            'courses': 'courses_list.json',
-            'course_details': 'course_details.json'
+                # 카테고리 레코드는 매 실행 새 수집일시를 가지므로 이를 빼고 비교
+                if (_without_timestamp(merged_data[data_type])
+                        == _without_timestamp(self.previous_data[data_type])):
+                    unchanged.add(data_type)
+
+        # 기존 파일이 없으면 (첫 실행, 레거시 형식) 내용이 같아도 새로 기록
+        unchanged = {data_type for data_type in unchanged
+                     if (self.json_dir / self.DATA_FILES[data_type]).exists()}
+        if unchanged:
+            self._log_progress("변경 없는 데이터 저장 생략: %s", ', '.join(sorted(unchanged)))
+
+        # JSON 파일 저장 (서로 독립적인 파일이므로 I/O 스레드에서 동시에 기록)
+        save_futures = {
+            data_type: self._io_executor.submit(
+                self._save_data_file, data_type, filename, merged_data[data_type])
+            for data_type, filename in self.DATA_FILES.items()
+            if data_type not in unchanged
         }
+        for data_type, hashes in merged_hashes.items():
+            index_path = self._hash_index_path(self.DATA_FILES[data_type])
+            if data_type in unchanged and index_path.exists():
+                continue
+            self._io_futures.append(self._io_executor.submit(
+                index_path.write_bytes, orjson.dumps(hashes)))
+        self._save_http_cache()
 
-        for data_type, filename in data_files.items():
-            json_path = self.output_dir / "json_files" / filename
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(merged_data[data_type], f, ensure_ascii=False, indent=2)
-            self._log_progress(f"{data_type} 저장 완료: {len(merged_data[data_type])}개")
+        for data_type, future in save_futures.items():
+            try:
+                self._log_progress("%s 저장 완료: %s개", data_type, future.result())
+            except Exception as e:
+                self._log_error("%s 저장 실패", data_type, error=e)
+        self._wait_for_io()
 
         # 증분 로그 저장
         self._save_incremental_log()
 
         self._log_step_complete("데이터 저장")
 
+    def _save_http_cache(self):
+        """HTTP 검증값 캐시가 바뀌었으면 I/O 스레드에서 저장."""
+        if self.http_cache != self._saved_http_cache:
+            self._io_futures.append(self._io_executor.submit(
+                (self.json_dir / "http_cache.json").write_bytes,
+                orjson.dumps(self.http_cache)))
+
+    def _save_data_file(self, data_type, filename, data):
+        """데이터 파일 하나 저장 (I/O 스레드용), 저장된 항목 수 반환."""
+        json_path = self.json_dir / filename
+        if json_path.suffix == '.jsonl':
+            # 변경분만 추가 (로그가 아직 없으면 이전 데이터부터 기록)
+            records = self.current_data[data_type]
+            if not json_path.exists():
+                records = chain(self.previous_data[data_type], records)
+            self._append_jsonl(json_path, records)
+            return len(data)
+
+        return self._write_json_array(json_path, data,
+                                      indent=data_type not in self.COMPACT_JSON_TYPES)
+
     def _save_incremental_log(self):
         """증분 크롤링 로그 저장."""
         log_data = {
@@ -856,26 +1222,64 @@ class IncrementalCrawler:
             "처리시간": time.time() - self.start_time
         }
 
-        log_file = self.output_dir / "incremental_logs" / f"log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, ensure_ascii=False, indent=2)
+        # 실행마다 파일을 만들지 않고 한 파일에 한 줄씩 추가
+        self._append_jsonl(self.log_dir / "runs.jsonl", [log_data])
 
     def _log_performance_improvement(self, elapsed_time):
         """성능 개선 효과 로깅."""
         estimated_full_time = 900  # 15분 예상
         improvement_percent = ((estimated_full_time - elapsed_time) / estimated_full_time) * 100
         
-        self._log_progress("=== 성능 개선 효과 ===")
-        self._log_progress(f"예상 전체 크롤링 시간: {estimated_full_time}초")
-        self._log_progress(f"실제 증분 크롤링 시간: {elapsed_time:.2f}초")
-        self._log_progress(f"시간 단축: {improvement_percent:.1f}%")
-        
         if improvement_percent > 90:
-            self._log_progress("🚀 우수한 성능 개선!")
+            verdict = "🚀 우수한 성능 개선!"
         elif improvement_percent > 70:
-            self._log_progress("✅ 좋은 성능 개선!")
+            verdict = "✅ 좋은 성능 개선!"
         else:
-            self._log_progress("⚠️ 성능 개선 필요")
+            verdict = "⚠️ 성능 개선 필요"
+
+        # 요약을 한 번에 만들어 로그 레코드 하나로 출력
+        self._log_progress("\n".join([
+            "=== 성능 개선 효과 ===",
+            f"예상 전체 크롤링 시간: {estimated_full_time}초",
+            f"실제 증분 크롤링 시간: {elapsed_time:.2f}초",
+            f"시간 단축: {improvement_percent:.1f}%",
+            verdict,
+        ]))
+
+    def _crawl(self, page):
+        """카테고리부터 저장까지 공통 크롤링 단계 실행, 소요시간 반환."""
+        # 메인 카테고리 확인
+        self._extract_main_categories(page)
+
+        # 하위 카테고리 확인
+        self._extract_sub_categories(page)
+
+        # 신규/업데이트된 하위 카테고리에서 강의 수집
+        self._collect_courses_incremental()
+
+        # 신규/업데이트된 강의의 상세 정보 수집
+        self._collect_course_details_incremental()
+
+        # 데이터 저장
+        self._save_incremental_data()
+
+        # 증분 크롤링 통계 출력
+        self._log_incremental_stats()
+
+        elapsed_time = time.time() - self.start_time
+        self._log_progress("증분 크롤링 완료! 총 소요시간: %.2f초", elapsed_time)
+        return elapsed_time
+
+    def _run_first(self, page):
+        """첫 실행: 이전 데이터가 없으므로 전체 크롤링만 수행."""
+        self._log_progress("첫 실행 감지 - 전체 크롤링 모드")
+        self._crawl(page)
+
+    def _run_incremental(self, page):
+        """재실행: 증분 크롤링 후 성능 개선 효과 표시."""
+        self._log_progress("재실행 감지 - 증분 크롤링 모드")
+        elapsed_time = self._crawl(page)
+        self._log_performance_improvement(elapsed_time)
 
     def run(self):
         """증분 크롤링 실행."""
@@ -885,13 +1289,6 @@ class IncrementalCrawler:
         # 이전 데이터 로드
         self._load_previous_data()
 
-        if self.is_first_run:
-            self._log_progress("첫 실행 감지 - 전체 크롤링 모드")
-            # 첫 실행 시에는 기존 크롤러와 동일하게 작동
-            # (여기서는 간단히 메인 카테고리만 확인)
-        else:
-            self._log_progress("재실행 감지 - 증분 크롤링 모드")
-
         with sync_playwright() as p:
             browser, page = self._setup_browser(p)
 
@@ -904,38 +1301,15 @@ class IncrementalCrawler:
 
                 self._log_progress("메인 페이지 로드 완료")
 
-                # 메인 카테고리 확인
-                self._extract_main_categories(page)
-
-                # 하위 카테고리 확인
-                self._extract_sub_categories(page)
-
-                # 신규/업데이트된 하위 카테고리에서 강의 수집
-                self._collect_courses_incremental()
-
-                # 신규/업데이트된 강의의 상세 정보 수집
-                self._collect_course_details_incremental()
-
-                # 데이터 저장
-                self._save_incremental_data()
-
-                # 증분 크롤링 통계 출력
-                self._log_incremental_stats()
-
-                # 완료
-                elapsed_time = time.time() - self.start_time
-                self._log_progress(f"증분 크롤링 완료! 총 소요시간: "
-                                 f"{elapsed_time:.2f}초")
-                
-                # 성능 개선 효과 표시
-                if not self.is_first_run:
-                    self._log_performance_improvement(elapsed_time)
+                # 실행 모드는 한 번만 판단하고 이후 단계는 각 모드 전용 흐름에서 처리
+                (self._run_first if self.is_first_run else self._run_incremental)(page)
 
             except Exception as e:
-                self._log_error("크롤링 중 치명적 오류 발생", e)
+                self._log_error("크롤링 중 치명적 오류 발생", error=e)
             finally:
                 browser.close()
                 self._log_progress("브라우저 종료")
+                self.close()
 
 
 def main():
@@ -1,15 +1,27 @@
 #!/usr/bin/env python3
-import json
+import hashlib
 import os
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import (parse_qsl, urlencode, urljoin, urlparse, urlsplit,
+                          urlunsplit)
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class FastCampusCrawler:
@@ -68,33 +80,251 @@ class FastCampusCrawler:
         'category_nav': '[data-e2e="navigation-category"]'
     }
     
+    # 카테고리 메뉴 버튼 선택자 (우선순위 순)
+    CATEGORY_BUTTON_SELECTORS = (
+        '[data-e2e="navigation-category"]',
+        '.category-button',
+        '.nav-category', 
+        '.gnb-category',
+        'button[aria-label*="카테고리"]',
+        'button:has-text("카테고리")'
+    )
+    
+    # 강의 카드 컨테이너 선택자 (우선순위 순)
+    COURSE_CARD_SELECTORS = (
+        '[data-e2e="course-card"]',
+        '.course-card', 
+        '.course-item',
+        'div[class*="CourseCard"]',
+        'div[class*="courseCard"]',
+        'div[class*="course-card"]',
+        'article[class*="course"]',
+        'div[class*="card"]'
+    )
+    
+    # 강의 카드 제목 선택자 - 사용자가 제공한 정확한 선택자 우선
+    CARD_TITLE_SELECTORS = (
+        '.CourseCard_courseCardTitle__1HQgO',  # 정확한 클래스명
+        '[data-e2e="display-card"]',  # data-e2e 속성
+        'h3', 'h4', '.course-title', '.title', 
+        '[data-e2e="course-title"]', '.course-name',
+        '[class*="title"]', '[class*="Title"]'
+    )
+    
+    # 강의 카드 썸네일 이미지 선택자 (우선순위 순)
+    THUMBNAIL_SELECTORS = (
+        'img[alt="강의 대표이미지"]',  # 가장 정확한 선택자
+        'img[class*="CourseCard"][data-nimg="fill"]',  # 조합 선택자
+        'img[class*="CourseCard"]',  # CourseCard 관련
+        'img[data-nimg="fill"]'  # Next.js 이미지
+    )
+    
+    # 강의 상세 페이지 제목 XPath (우선순위 순)
+    TITLE_XPATHS = [
+        '//h1',
+        '//*[@data-e2e="course-title"]',
+        '//*[contains(concat(" ", normalize-space(@class), " "), " title ")]'
+    ]
+    
+    # 브라우저에서 실행할 추출 스크립트 (클래스에 한 번만 정의)
+    MAIN_CATEGORY_LINKS_SCRIPT = (
+        "els => els.map(e => [e.textContent.trim(), e.getAttribute('href')])"
+    )
+    SUB_CATEGORY_LINKS_SCRIPT = """
+        els => els.map(e => {
+            const container = e.closest(
+                'div.GNBDesktopCategoryItem_container__ln5E6');
+            const main = container &&
+                container.querySelector('a[href*="category_online"]');
+            return [e.textContent.trim(), e.getAttribute('href'),
+                    main ? main.textContent.trim() : null];
+        })
+    """
+    SCROLL_TO_LAST_VISIBLE_SCRIPT = """
+        (selector) => {
+            const items = document.querySelectorAll(selector);
+            for (let i = items.length - 1; i >= 0; i--) {
+                if (items[i].getClientRects().length) {
+                    items[i].scrollIntoView({block: 'end'});
+                    break;
+                }
+            }
+            return items.length;
+        }
+    """
+    JSON_SCRIPTS_SCRIPT = """
+        () => {
+            const scripts = Array.from(
+                document.querySelectorAll('script[type="application/json"]'));
+            const nextData = document.querySelector('script#__NEXT_DATA__');
+            if (nextData) {
+                scripts.unshift(nextData);
+            }
+            return scripts.map(script => script.textContent);
+        }
+    """
+    COURSE_CARDS_SCRIPT = """
+        ([cardSelectors, linkSelector, titleSelectors, imageSelectors]) => {
+            let selector = linkSelector;
+            let cards = [];
+            for (const candidate of cardSelectors) {
+                cards = Array.from(document.querySelectorAll(candidate));
+                if (cards.length) {
+                    selector = candidate;
+                    break;
+                }
+            }
+            if (!cards.length) {
+                cards = Array.from(document.querySelectorAll(linkSelector));
+            }
+            
+            const isValid = (text) => text.length > 3 
+                && !/^\\d+$/.test(text) && !text.endsWith('+');
+            
+            // 링크가 없거나 이벤트/중복 링크인 카드는 제목/이미지를 읽기 전에 제외
+            const seen = new Set();
+            return {selector, cards: cards.map(card => {
+                let url = card.getAttribute('href');
+                if (!url) {
+                    const link = card.querySelector(linkSelector);
+                    url = link ? link.getAttribute('href') : null;
+                }
+                if (!url || url.includes('/event_online_') || seen.has(url)) {
+                    return null;
+                }
+                seen.add(url);
+                
+                let title = null;
+                let titleSelector = null;
+                for (const candidate of titleSelectors) {
+                    const element = card.querySelector(candidate);
+                    const text = element ? (element.textContent || '').trim() : '';
+                    if (isValid(text)) {
+                        title = text;
+                        titleSelector = candidate;
+                        break;
+                    }
+                }
+                // 썸네일 후보 src (선택자 우선순위 순)
+                const images = [];
+                for (const candidate of imageSelectors) {
+                    for (const img of card.querySelectorAll(candidate)) {
+                        const src = img.getAttribute('src')
+                            || img.getAttribute('data-src');
+                        if (src) {
+                            images.push(src);
+                        }
+                    }
+                }
+                
+                // 제목을 못 찾은 카드만 fallback용 전체 텍스트를 넘김
+                return {url, title, titleSelector, images,
+                        text: title ? '' : (card.textContent || '')};
+            }).filter(Boolean)};
+        }
+    """
+    
+    # 페이지 로드 시 차단할 리소스 (문서/스크립트/XHR은 JSON 데이터에 필요하므로 허용)
+    BLOCKED_RESOURCE_TYPES = {'media', 'font', 'websocket'}
+    # 분석/광고 도메인 (하위 도메인 포함)
+    BLOCKED_HOSTS = frozenset({
+        'googletagmanager.com', 'google-analytics.com', 'doubleclick.net',
+        'facebook.net'
+    })
+    
     # 이미지 관련 상수
     VALID_IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg']
+    # 이미지 확장자 또는 CDN/이미지 키워드 (대소문자 무시)
+    IMAGE_URL_PATTERN = re.compile(
+        '|'.join(map(re.escape, VALID_IMAGE_EXTENSIONS 
+                     + ['cdn', 'image', 'thumbnail'])),
+        re.IGNORECASE
+    )
     MIN_IMAGE_SIZE = 1000
+    MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 이보다 큰 응답은 이미지로 보지 않음
     MAX_THUMBNAILS = 2
+    IMAGE_WORKERS = 16
+    
+    # 같은 강의 URL을 구분하지 않는 추적용 쿼리 파라미터
+    TRACKING_PARAMS = frozenset({'fbclid', 'gclid'})
+    
+    # 이 시간 안에 저장한 페이지는 다시 열지 않음 (초)
+    PAGE_CACHE_TTL = 24 * 60 * 60
+    
+    # 단계별 처리 개수 기본값 (None이면 전체 처리)
+    DEFAULT_LIMITS = {
+        'main': 2,     # HTML을 저장할 메인 카테고리 수
+        'sub': 2,      # HTML 저장/강의 수집할 하위 카테고리 수
+        'courses': 2,  # 하위 카테고리별 수집할 강의 수
+        'details': 2   # 상세 정보를 수집할 강의 수
+    }
+    
+    # 병렬 처리 관련 상수
+    MAX_WORKERS = 4  # 동시에 처리할 하위 카테고리 수 (워커별 브라우저 1개)
+    TASK_TIMEOUT = 180  # 워커 작업 하나의 결과를 기다리는 최대 시간 (초)
     
     def __init__(self, base_url="https://fastcampus.co.kr/", 
-                 output_dir="./json_mvp"):
+                 output_dir="./json_mvp", block_resources=True, limits=None):
         """크롤러 초기화.
         
         Args:
             base_url (str): 크롤링할 기본 URL
             output_dir (str): 출력 디렉토리 경로
+            block_resources (bool): 불필요한 리소스와 분석 요청 차단 여부
+            limits (dict, optional): DEFAULT_LIMITS 중 바꿀 단계별 처리 개수
         """
         self.base_url = base_url
+        self.block_resources = block_resources
+        self.limits = {**self.DEFAULT_LIMITS, **(limits or {})}
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
         self.data = {
             'main_categories': [],
             'sub_categories': [],
-            'courses': [],
-            'course_details': []
+            'courses': []
         }
+        # 강의 상세는 NDJSON에 바로 추가하고 메모리에는 개수만 유지
+        self.course_detail_count = 0
         self.seen_urls = set()
+        self._seen_lock = threading.Lock()
         self.current_step = 0
         self.start_time = None
+        self._run_timestamp = None
         self.course_titles = {}  # URL -> 제목 매핑 저장
+        # 호출 위치별로 처음 성공한 선택자 (다음 호출에서 먼저 시도)
+        self._category_button_selector = None
+        self._card_selector = None
+        # 강의 카드 스크립트에 매번 넘기는 고정 선택자 목록
+        self._card_script_selectors = [list(self.CARD_TITLE_SELECTORS),
+                                       list(self.THUMBNAIL_SELECTORS)]
+        self._img_session = self._setup_http_session(self.HEADERS['image'])
+        # 서버 렌더링된 페이지는 브라우저 없이 바로 받음
+        # (br 응답은 brotli 모듈이 없으면 풀 수 없으므로 gzip/deflate만 요청)
+        self._html_session = self._setup_http_session(
+            {**self.HEADERS['default'], 'Accept-Encoding': 'gzip, deflate'})
+        
+        # 실행 간 공유하는 이미지 캐시 (URL -> 내용 해시, 내용 해시 -> 저장 경로)
+        self._img_cache_path = self.output_dir / "json_files" / "image_cache.json"
+        self._img_cache, self._img_content_paths = self._load_image_cache()
+        self._img_cache_lock = threading.Lock()
+        self._img_pool = ThreadPoolExecutor(max_workers=self.IMAGE_WORKERS,
+                                            thread_name_prefix='fcam-img')
+        
+        # 실행 간 공유하는 강의 상세 캐시 (URL -> 수집 시각과 상세 정보)
+        self._detail_cache_path = self.output_dir / "json_files" / "detail_cache.json"
+        self._detail_cache = self._load_detail_cache()
+        self._detail_cache_lock = threading.Lock()
+        
+        # 페이지 작업용 스레드 풀과 워커 스레드별 Playwright 브라우저
+        self.executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS,
+                                           thread_name_prefix='fcam-worker')
+        self._thread_local = threading.local()
+        
+        # 파일 저장 전용 스레드 (크롤링은 기록 완료를 기다리지 않고 진행)
+        self._io_executor = ThreadPoolExecutor(max_workers=1,
+                                              thread_name_prefix='fcam-io')
+        self._io_futures = []
         
         self._setup_directories()
         self._log_progress("크롤러 초기화 완료")
@@ -109,6 +339,122 @@ class FastCampusCrawler:
         for directory in directories:
             (self.output_dir / directory).mkdir(exist_ok=True)
     
+    def _setup_http_session(self, headers):
+        """HTTP 세션 생성.
+        
+        Args:
+            headers (dict): 세션 기본 헤더
+            
+        Returns:
+            requests.Session: 연결 풀과 재시도 정책이 설정된 세션
+        """
+        session = requests.Session()
+        session.headers.update(headers)
+        
+        # 같은 호스트에 대한 연결을 재사용하고 일시적 오류는 자동 재시도
+        retry = Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def close(self):
+        """워커 브라우저, 스레드 풀 및 HTTP 세션 종료."""
+        # sync Playwright 객체는 만든 스레드에서만 닫을 수 있으므로
+        # 모든 워커 스레드에 종료 작업을 하나씩 배정
+        barrier = threading.Barrier(self.MAX_WORKERS)
+        futures = [self.executor.submit(self._close_worker_browser, barrier)
+                   for _ in range(self.MAX_WORKERS)]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                self._log_error("워커 브라우저 종료 실패", e)
+        
+        self.executor.shutdown(wait=True)
+        self._img_pool.shutdown(wait=True)
+        self._wait_for_io()
+        self._io_executor.shutdown(wait=True)
+        self._img_session.close()
+        self._html_session.close()
+    
+    def _write_in_background(self, path, data):
+        """파일 기록을 I/O 스레드에 맡김.
+        
+        Args:
+            path (Path): 저장 경로
+            data (bytes | str): 기록할 내용 (문자열은 UTF-8로 저장)
+        """
+        if isinstance(data, str):
+            future = self._io_executor.submit(path.write_text, data,
+                                              encoding='utf-8')
+        else:
+            future = self._io_executor.submit(path.write_bytes, data)
+        self._io_futures.append(future)
+    
+    def _append_ndjson(self, ndjson_path, record):
+        """레코드 한 줄을 I/O 스레드에서 NDJSON 파일에 추가.
+        
+        Args:
+            ndjson_path (Path): NDJSON 파일 경로
+            record (dict): 추가할 레코드
+        """
+        future = self._io_executor.submit(self._append_record, ndjson_path, record)
+        self._io_futures.append(future)
+    
+    @staticmethod
+    def _append_record(path, record):
+        """레코드를 인코딩해 파일 끝에 한 줄로 추가."""
+        with open(path, 'ab') as f:
+            f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+    
+    @staticmethod
+    def load_ndjson(ndjson_path):
+        """NDJSON 파일의 레코드를 한 줄씩 읽음.
+        
+        Args:
+            ndjson_path (Path | str): NDJSON 파일 경로
+            
+        Yields:
+            dict: 파일에 저장된 순서대로의 레코드
+        """
+        with open(ndjson_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+    
+    def _wait_for_io(self):
+        """백그라운드 파일 저장 완료 대기 및 실패 보고."""
+        futures, self._io_futures = self._io_futures, []
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                self._log_error("파일 저장 실패", e)
+    
+    def _task_result(self, future):
+        """워커 작업 결과를 제한 시간까지만 기다림.
+        
+        Args:
+            future (Future): 워커 풀에 제출한 작업
+            
+        Returns:
+            작업 결과
+            
+        Raises:
+            FutureTimeoutError: 제한 시간 안에 끝나지 않은 경우
+        """
+        try:
+            return future.result(timeout=self.TASK_TIMEOUT)
+        except FutureTimeoutError:
+            # 아직 시작하지 않은 작업만 취소되고, 실행 중인 작업은 계속 돌지만
+            # 결과는 사용하지 않음
+            future.cancel()
+            raise FutureTimeoutError(
+                f"{self.TASK_TIMEOUT}초 안에 끝나지 않아 결과를 버림") from None
+    
     def _log_progress(self, message, step=None):
         """진행 상황 로깅.
         
@@ -172,53 +518,180 @@ class FastCampusCrawler:
             tuple: (browser, page) 튜플
         """
         browser = playwright.chromium.launch(headless=True)
+        _, page = self._new_context(browser)
+        return browser, page
+    
+    def _new_context(self, browser, block_images=False):
+        """이미 띄운 브라우저에 새 컨텍스트와 페이지 생성.
+        
+        브라우저 프로세스를 새로 띄우는 대신 컨텍스트만 만들어 쿠키/캐시를 격리한다.
+        
+        Args:
+            browser: Playwright 브라우저 객체
+            block_images (bool): 이미지 요청까지 차단할지 여부
+            
+        Returns:
+            tuple: (context, page) 튜플 - 사용 후 context만 닫으면 됨
+        """
+        # 녹화/HAR/트레이싱은 켜지 않고, 서비스 워커의 백그라운드 요청과
+        # CSS 애니메이션도 끔
         context = browser.new_context(
             viewport={'width': 1920, 'height': 1080},
             user_agent=self.HEADERS['default']['User-Agent'],
-            extra_http_headers=self.HEADERS['default']
+            extra_http_headers=self.HEADERS['default'],
+            service_workers='block',
+            reduced_motion='reduce'
         )
+        
+        if self.block_resources:
+            blocked_types = set(self.BLOCKED_RESOURCE_TYPES)
+            if block_images:
+                blocked_types.add('image')
+            
+            def route_handler(route):
+                request = route.request
+                if (request.resource_type in blocked_types
+                        or self._is_blocked_host(request.url)):
+                    route.abort()
+                else:
+                    route.continue_()
+            
+            context.route("**/*", route_handler)
+        # 이 컨텍스트에서 여는 모든 페이지에 같은 타임아웃 적용
+        context.set_default_timeout(self.TIMEOUTS['default'])
+        context.set_default_navigation_timeout(self.TIMEOUTS['navigation'])
         page = context.new_page()
-        page.set_default_timeout(self.TIMEOUTS['default'])
-        page.set_default_navigation_timeout(self.TIMEOUTS['navigation'])
-        return browser, page
+        return context, page
     
-    def _safe_page_load(self, page, url, retries=3):
+    def _is_blocked_host(self, url):
+        """요청 URL이 차단 대상 도메인(하위 도메인 포함)인지 확인.
+        
+        Args:
+            url (str): 요청 URL
+            
+        Returns:
+            bool: 차단 대상 여부
+        """
+        labels = (urlparse(url).hostname or '').split('.')
+        return any('.'.join(labels[i:]) in self.BLOCKED_HOSTS
+                   for i in range(len(labels) - 1))
+    
+    @contextmanager
+    def _worker_page(self, block_images=False):
+        """워커 스레드 전용 브라우저에서 작업용 페이지 생성.
+        
+        브라우저와 컨텍스트는 스레드마다 한 번만 만들고, 작업마다 페이지만 새로 연다.
+        같은 컨텍스트를 쓰므로 쿠키와 HTTP 캐시가 작업 사이에 유지된다.
+        
+        Args:
+            block_images (bool): 이미지 요청까지 차단할지 여부
+            
+        Yields:
+            Playwright 페이지 객체
+        """
+        if getattr(self._thread_local, 'browser', None) is None:
+            self._thread_local.playwright = sync_playwright().start()
+            self._thread_local.browser = (
+                self._thread_local.playwright.chromium.launch(headless=True))
+            # 이미지 차단 여부별 컨텍스트
+            self._thread_local.contexts = {}
+        
+        context = self._thread_local.contexts.get(block_images)
+        if context is None:
+            context, page = self._new_context(self._thread_local.browser,
+                                              block_images)
+            self._thread_local.contexts[block_images] = context
+        else:
+            page = context.new_page()
+        
+        try:
+            yield page
+        finally:
+            page.close()
+    
+    def _close_worker_browser(self, barrier):
+        """현재 워커 스레드의 브라우저 종료.
+        
+        Args:
+            barrier (threading.Barrier): 모든 워커가 하나씩 맡도록 맞추는 배리어
+        """
+        try:
+            barrier.wait(timeout=60)
+        except threading.BrokenBarrierError:
+            pass
+        
+        browser = getattr(self._thread_local, 'browser', None)
+        if browser is not None:
+            browser.close()
+            self._thread_local.playwright.stop()
+            self._thread_local.browser = None
+            self._thread_local.contexts = {}
+    
+    def _safe_page_load(self, page, url, retries=3, wait_selector=None,
+                        wait_until="domcontentloaded"):
         """안전한 페이지 로딩.
         
         Args:
             page: Playwright 페이지 객체
             url (str): 로드할 URL
             retries (int): 재시도 횟수
+            wait_selector (str, optional): DOM 로드 후 나타날 때까지 기다릴 선택자
+            wait_until (str): goto가 기다릴 로드 단계
             
         Returns:
             bool: 로딩 성공 여부
         """
         for attempt in range(retries):
             try:
-                page.goto(url, timeout=self.TIMEOUTS['navigation'])
-                page.wait_for_load_state("networkidle", timeout=30000)
+                # 광고/분석 요청으로 networkidle이 늦어지므로 DOM 로드까지만 대기
+                page.goto(url, wait_until=wait_until,
+                          timeout=self.TIMEOUTS['navigation'])
+                if wait_selector:
+                    try:
+                        page.wait_for_selector(wait_selector, timeout=10000)
+                    except Exception:
+                        pass  # 선택자가 없어도 DOM은 이미 로드됨
                 return True
             except Exception:
                 if attempt < retries - 1:
                     page.wait_for_timeout(3000)
         return False
     
-    def _scroll_page(self, page):
-        """동적 콘텐츠 로드를 위한 스크롤.
+    def _scroll_page(self, page, anchor):
+        """지연 로드되는 목록이 더 늘어나지 않을 때까지 마지막 항목으로 스크롤.
         
         Args:
             page: Playwright 페이지 객체
+            anchor (str): 목록 항목 선택자
         """
-        last_height = page.evaluate("document.body.scrollHeight")
+        # 숨겨진 항목(캐러셀/메뉴 링크 등)은 건너뛰고 보이는 마지막 항목으로 스크롤
+        count = page.evaluate(self.SCROLL_TO_LAST_VISIBLE_SCRIPT, anchor)
         
-        while True:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
-            new_height = page.evaluate("document.body.scrollHeight")
-            
-            if new_height == last_height:
+        while count:
+            # 고정 대기 대신 항목 수가 늘어나는 즉시 다음 스크롤 진행
+            try:
+                page.wait_for_function(
+                    "([selector, count]) => "
+                    "document.querySelectorAll(selector).length > count",
+                    arg=[anchor, count], timeout=3000)
+            except PlaywrightTimeoutError:
                 break
-            last_height = new_height
+            count = page.evaluate(self.SCROLL_TO_LAST_VISIBLE_SCRIPT, anchor)
+    
+    @staticmethod
+    def _prioritize(selectors, hit):
+        """이전에 성공한 선택자를 맨 앞으로 옮긴 선택자 목록.
+        
+        Args:
+            selectors (tuple): 우선순위 순 선택자 목록
+            hit (str, optional): 이전에 성공한 선택자
+            
+        Returns:
+            tuple: 시도할 순서대로 정렬된 선택자 목록
+        """
+        if hit is None:
+            return selectors
+        return (hit,) + tuple(selector for selector in selectors if selector != hit)
     
     def _prepare_navigation(self, page):
         """네비게이션 준비.
@@ -226,37 +699,41 @@ class FastCampusCrawler:
         Args:
             page: Playwright 페이지 객체
         """
+        # 카테고리 버튼 클릭 - 이전에 성공한 선택자부터 시도
+        selectors = self._prioritize(self.CATEGORY_BUTTON_SELECTORS,
+                                     self._category_button_selector)
+        
+        try:
+            # networkidle 대신 클릭할 버튼 후보 중 하나가 보이는 즉시 진행
+            page.locator(', '.join(selectors)).first.wait_for(
+                state='visible', timeout=self.TIMEOUTS['default'])
+        except Exception:
+            pass
+        
         try:
             # 팝업 마스크 제거
             popup_mask = page.locator('.fc-popup-mask')
             if popup_mask.is_visible():
                 popup_mask.evaluate('element => element.remove()')
-                page.wait_for_timeout(1000)
         except Exception:
             pass
         
         try:
-            # 페이지가 완전히 로드될 때까지 대기
-            page.wait_for_load_state("networkidle", timeout=30000)
-            
-            # 카테고리 버튼 클릭 - 여러 선택자 시도
-            selectors = [
-                '[data-e2e="navigation-category"]',
-                '.category-button',
-                '.nav-category', 
-                '.gnb-category',
-                'button[aria-label*="카테고리"]',
-                'button:has-text("카테고리")'
-            ]
-            
             clicked = False
             for selector in selectors:
                 try:
                     button = page.locator(selector).first
                     if button.is_visible(timeout=5000):
                         button.click(timeout=10000)
-                        page.wait_for_timeout(3000)
+                        # 메뉴의 카테고리 링크가 붙는 즉시 진행
+                        try:
+                            page.wait_for_selector(
+                                self.SELECTORS['main_category'],
+                                state='attached', timeout=10000)
+                        except PlaywrightTimeoutError:
+                            pass
                         clicked = True
+                        self._category_button_selector = selector
                         self._log_progress(f"카테고리 버튼 클릭 성공: {selector}")
                         break
                 except Exception:
@@ -276,14 +753,13 @@ class FastCampusCrawler:
         """
         self._log_step_start("메인 카테고리 수집")
         self._prepare_navigation(page)
-        links = page.locator(self.SELECTORS['main_category']).all()
+        # 링크마다 텍스트/href를 따로 조회하지 않고 한 번의 evaluate로 읽음
+        links = page.eval_on_selector_all(self.SELECTORS['main_category'],
+                                          self.MAIN_CATEGORY_LINKS_SCRIPT)
         seen = set()
 
-        for i, link in enumerate(links, 1):
+        for i, (name, url) in enumerate(links, 1):
             try:
-                name = link.text_content().strip()
-                url = link.get_attribute('href')
-
                 if (name and url and name in self.MAIN_CATEGORIES 
                     and name not in seen):
                     seen.add(name)
@@ -294,7 +770,7 @@ class FastCampusCrawler:
                     self.data['main_categories'].append({
                         "메인카테고리": name,
                         "메인카테고리링크": url,
-                        "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        "수집일시": self._run_timestamp
                     })
                     self._log_progress(f"메인 카테고리 발견: {name}")
             except Exception as e:
@@ -304,28 +780,6 @@ class FastCampusCrawler:
         self._log_step_complete("메인 카테고리 수집", 
                                len(self.data['main_categories']))
     
-    def _find_parent_category(self, sub_link):
-        """상위 카테고리 찾기.
-        
-        Args:
-            sub_link: 하위 카테고리 링크 요소
-            
-        Returns:
-            str: 상위 카테고리 이름 또는 None
-        """
-        try:
-            xpath = ('xpath=ancestor::div[contains(@class, '
-                    '"GNBDesktopCategoryItem_container__ln5E6")]')
-            parent = sub_link.locator(xpath).first
-            
-            if parent.count() > 0:
-                main_link = parent.locator('a[href*="category_online"]').first
-                if main_link.count() > 0:
-                    return main_link.text_content().strip()
-        except Exception:
-            pass
-        return None
-    
     def _extract_sub_categories(self, page):
         """하위 카테고리 추출.
         
@@ -334,18 +788,16 @@ class FastCampusCrawler:
         """
         self._log_step_start("하위 카테고리 수집")
         self._prepare_navigation(page)
-        links = page.locator(self.SELECTORS['sub_category']).all()
+        # 링크 텍스트/href와 상위 카테고리 이름을 브라우저 안에서 한 번에 읽음
+        links = page.eval_on_selector_all(self.SELECTORS['sub_category'],
+                                          self.SUB_CATEGORY_LINKS_SCRIPT)
         
-        for i, link in enumerate(links, 1):
+        for i, (name, url, parent) in enumerate(links, 1):
             try:
-                name = link.text_content().strip()
-                url = link.get_attribute('href')
-
                 if not name or not url or url in self.seen_urls:
                     continue
                 
                 self.seen_urls.add(url)
-                parent = self._find_parent_category(link)
                 
                 if parent:
                     if url.startswith('/'):
@@ -355,7 +807,7 @@ class FastCampusCrawler:
                         "메인카테고리": parent,
                         "하위카테고리": name,
                         "하위카테고리링크": url,
-                        "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        "수집일시": self._run_timestamp
                     })
                     self._log_progress(f"하위 카테고리 발견: {parent} > {name}")
             except Exception as e:
@@ -365,6 +817,62 @@ class FastCampusCrawler:
         self._log_step_complete("하위 카테고리 수집", 
                                len(self.data['sub_categories']))
     
+    def _fetch_static_html(self, url):
+        """브라우저 없이 페이지 HTML 요청.
+        
+        Args:
+            url (str): 페이지 URL
+            
+        Returns:
+            str | None: 강의 링크가 포함된 서버 렌더링 HTML, 아니면 None
+        """
+        try:
+            response = self._html_session.get(
+                url, timeout=self.TIMEOUTS['default'] / 1000)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self._log_error(f"정적 페이지 요청 실패: {url}", e)
+            return None
+        
+        # 강의 링크가 없으면 스켈레톤만 내려온 JS 렌더링 페이지로 판단
+        html_content = response.text
+        if '/data_online_' not in html_content:
+            return None
+        return html_content
+    
+    def _save_category_html(self, url, name, category_type):
+        """카테고리 페이지 HTML 저장.
+        
+        서버 렌더링된 HTML을 먼저 받아 보고, 강의 목록이 비어 있을 때만
+        워커 브라우저로 렌더링한다.
+        
+        Args:
+            url (str): 카테고리 페이지 URL
+            name (str): 파일명으로 사용할 이름
+            category_type (str): 카테고리 타입 (폴더명)
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if self._is_fresh(self._html_path(name, category_type)):
+            self._log_progress(f"최근 저장한 HTML 재사용: {name}")
+            return True
+        
+        html_content = self._fetch_static_html(url)
+        if html_content is not None:
+            self._write_html(html_content, name, category_type)
+            return True
+        
+        with self._worker_page() as page:
+            # 렌더링된 HTML만 필요하므로 응답 수신 직후부터 강의 링크를 기다림
+            if not self._safe_page_load(page, url,
+                                        wait_selector=self.SELECTORS['course_link'],
+                                        wait_until="commit"):
+                return False
+            self._scroll_page(page, self.SELECTORS['course_link'])
+            self._save_html(page, name, category_type)
+            return True
+    
     def _save_html(self, page, name, category_type):
         """HTML 콘텐츠 저장.
         
@@ -373,18 +881,51 @@ class FastCampusCrawler:
             name (str): 파일명으로 사용할 이름
             category_type (str): 카테고리 타입 (폴더명)
         """
-        html_content = page.content()
+        self._write_html(page.content(), name, category_type)
+    
+    def _write_html(self, html_content, name, category_type):
+        """HTML 문자열을 카테고리 폴더에 저장.
+        
+        Args:
+            html_content (str): 저장할 HTML
+            name (str): 파일명으로 사용할 이름
+            category_type (str): 카테고리 타입 (폴더명)
+        """
+        self._write_in_background(self._html_path(name, category_type),
+                                  html_content)
+    
+    def _html_path(self, name, category_type):
+        """카테고리 HTML 저장 경로.
+        
+        Args:
+            name (str): 파일명으로 사용할 이름
+            category_type (str): 카테고리 타입 (폴더명)
+            
+        Returns:
+            Path: HTML 파일 경로
+        """
         safe_name = name.replace('/', '_').replace(' ', '_')
-        html_file = self.output_dir / f"{category_type}/{safe_name}.html"
+        return self.output_dir / f"{category_type}/{safe_name}.html"
+    
+    def _is_fresh(self, path):
+        """파일이 캐시 유효 시간 안에 저장되었는지 확인.
         
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        Args:
+            path (Path): 확인할 파일 경로
+            
+        Returns:
+            bool: 유효 시간 안에 저장된 파일이 있으면 True
+        """
+        try:
+            return time.time() - path.stat().st_mtime < self.PAGE_CACHE_TTL
+        except OSError:
+            return False
     
     def _extract_title(self, card, course_url=None):
         """강의 제목 추출.
         
         Args:
-            card: 강의 카드 요소
+            card (dict): 브라우저에서 읽어 온 강의 카드 정보
             course_url (str, optional): 강의 URL
             
         Returns:
@@ -394,28 +935,14 @@ class FastCampusCrawler:
         if course_url and course_url in self.course_titles:
             return self.course_titles[course_url]
         
-        # DOM에서 추출 - 사용자가 제공한 정확한 선택자 우선 사용
-        selectors = [
-            '.CourseCard_courseCardTitle__1HQgO',  # 정확한 클래스명
-            '[data-e2e="display-card"]',  # data-e2e 속성
-            'h3', 'h4', '.course-title', '.title', 
-            '[data-e2e="course-title"]', '.course-name',
-            '[class*="title"]', '[class*="Title"]'
-        ]
-        
-        for selector in selectors:
-            element = card.locator(selector).first
-            if element.count() > 0:
-                title = element.text_content().strip()
-                if (title and len(title) > 3 and not title.isdigit() 
-                    and not title.endswith('+')):
-                    self._log_progress(f"강의 제목 추출 성공: {title[:50]}... "
-                                     f"(선택자: {selector})")
-                    return title
+        # 제목 선택자로 찾은 텍스트 (브라우저에서 우선순위 순으로 확인함)
+        if card['title']:
+            self._log_progress(f"강의 제목 추출 성공: {card['title'][:50]}... "
+                             f"(선택자: {card['titleSelector']})")
+            return card['title']
         
         # 마지막 fallback - 숫자가 아닌 텍스트 찾기
-        full_text = card.text_content().strip()
-        lines = [line.strip() for line in full_text.split('\n') 
+        lines = [line.strip() for line in card['text'].strip().split('\n') 
                 if line.strip()]
         
         for line in lines:
@@ -428,31 +955,6 @@ class FastCampusCrawler:
                 
         return "제목 없음"
     
-    def _extract_course_url(self, card):
-        """강의 URL 추출.
-        
-        Args:
-            card: 강의 카드 요소
-            
-        Returns:
-            str: 강의 URL 또는 None
-        """
-        try:
-            url = card.get_attribute('href')
-            if url:
-                return url
-        except Exception:
-            pass
-        
-        try:
-            link = card.locator(self.SELECTORS['course_link']).first
-            if link.count() > 0:
-                return link.get_attribute('href')
-        except Exception:
-            pass
-        
-        return None
-    
     def _normalize_url(self, url):
         """URL 정규화.
         
@@ -470,31 +972,169 @@ class FastCampusCrawler:
             return urljoin(self.base_url, url)
         return url.replace('hhttps://', 'https://')
     
-    def _download_image(self, url, retries=3):
+    def _canonical_url(self, url):
+        """추적용 쿼리 파라미터와 프래그먼트를 제거한 URL.
+        
+        Args:
+            url (str): 원본 URL
+            
+        Returns:
+            str: 같은 페이지를 가리키는 링크끼리 동일해지는 URL
+        """
+        parts = urlsplit(url)
+        if not parts.query and not parts.fragment:
+            return url
+        
+        query = urlencode([(key, value) for key, value in parse_qsl(parts.query)
+                           if not key.startswith('utm_')
+                           and key not in self.TRACKING_PARAMS])
+        return urlunsplit(parts._replace(query=query, fragment=''))
+    
+    def _load_image_cache(self):
+        """이전 실행의 이미지 캐시 로드.
+        
+        Returns:
+            tuple: (URL -> 내용 해시, 내용 해시 -> 저장 경로) 딕셔너리 튜플
+        """
+        try:
+            cache = orjson.loads(self._img_cache_path.read_bytes())
+            return cache['urls'], cache['contents']
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            return {}, {}
+    
+    def _save_image_cache(self):
+        """이미지 캐시를 다음 실행을 위해 저장."""
+        with self._img_cache_lock:
+            payload = orjson.dumps({'urls': self._img_cache,
+                                    'contents': self._img_content_paths})
+        self._write_in_background(self._img_cache_path, payload)
+    
+    def _load_detail_cache(self):
+        """이전 실행의 강의 상세 캐시 중 유효 시간이 남은 항목만 로드.
+        
+        Returns:
+            dict: URL -> {'fetched': 수집 시각, 'detail': 상세 정보}
+        """
+        try:
+            cache = orjson.loads(self._detail_cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        
+        cutoff = time.time() - self.PAGE_CACHE_TTL
+        return {url: entry for url, entry in cache.items()
+                if entry.get('fetched', 0) > cutoff}
+    
+    def _save_detail_cache(self):
+        """강의 상세 캐시를 다음 실행을 위해 저장."""
+        with self._detail_cache_lock:
+            payload = orjson.dumps(self._detail_cache)
+        self._write_in_background(self._detail_cache_path, payload)
+    
+    def _fetch_image(self, url):
+        """이미지 내용 가져오기 (이미 받은 URL은 로컬 파일에서 읽음).
+        
+        Args:
+            url (str): 이미지 URL
+            
+        Returns:
+            bytes: 이미지 내용 또는 None
+        """
+        with self._img_cache_lock:
+            digest = self._img_cache.get(url)
+            cached_path = self._img_content_paths.get(digest)
+        
+        if cached_path:
+            content = self._read_if_digest(cached_path, digest)
+            if content is not None:
+                return content
+        
+        return self._download_image(url)
+    
+    @staticmethod
+    def _read_if_digest(path, digest):
+        """파일 내용이 주어진 해시와 같을 때만 반환.
+        
+        Args:
+            path (str | Path): 파일 경로
+            digest (str): 기대하는 SHA-256 해시
+            
+        Returns:
+            bytes: 파일 내용, 파일이 없거나 다른 이미지로 바뀌었으면 None
+        """
+        try:
+            content = Path(path).read_bytes()
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != digest:
+            return None
+        return content
+    
+    def _write_image(self, url, content, path):
+        """이미지 파일 저장 (같은 내용의 파일이 이미 있으면 하드링크).
+        
+        Args:
+            url (str): 이미지 URL
+            content (bytes): 이미지 내용
+            path (Path): 저장 경로
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        with self._img_cache_lock:
+            existing = self._img_content_paths.get(digest)
+        
+        canonical = str(path)
+        # 파일명은 강의별 순번이라 실행 사이에 다른 이미지로 덮어써질 수 있으므로
+        # 캐시된 경로는 실제 내용을 확인한 뒤에만 재사용
+        if (existing != canonical
+                or self._read_if_digest(path, digest) is None):
+            # 기존 파일이 다른 파일과 하드링크로 묶여 있을 수 있으므로 먼저 삭제
+            path.unlink(missing_ok=True)
+            linked = False
+            if (existing and existing != canonical
+                    and self._read_if_digest(existing, digest) is not None):
+                try:
+                    os.link(existing, path)
+                    linked = True
+                    canonical = existing
+                except OSError:
+                    pass  # 원본이 없거나 하드링크를 지원하지 않으면 직접 기록
+            if not linked:
+                path.write_bytes(content)
+        
+        with self._img_cache_lock:
+            self._img_content_paths[digest] = canonical
+            self._img_cache[url] = digest
+    
+    def _download_image(self, url):
         """이미지 다운로드.
         
         Args:
             url (str): 이미지 URL
-            retries (int): 재시도 횟수
             
         Returns:
-            requests.Response: 응답 객체 또는 None
+            bytes: 이미지 내용 또는 None
         """
-        for attempt in range(retries):
-            try:
-                response = requests.get(
-                    url, 
-                    timeout=15, 
-                    headers=self.HEADERS['image']
-                )
-                if response.status_code == 200:
-                    return response
-                elif attempt < retries - 1:
-                    time.sleep(1)
-            except Exception:
-                if attempt < retries - 1:
-                    time.sleep(1)
-        return None
+        # 재시도는 세션 어댑터의 Retry 정책이 처리
+        try:
+            with self._img_session.get(url, timeout=15, stream=True) as response:
+                if response.status_code != 200:
+                    return None
+                
+                # 오류 페이지(HTML 등)나 너무 큰 파일은 본문을 받기 전에 거름
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and not content_type.startswith('image/'):
+                    return None
+                length = response.headers.get('Content-Length')
+                if length and length.isdigit() and int(length) > self.MAX_IMAGE_SIZE:
+                    return None
+                
+                content = bytearray()
+                for chunk in response.iter_content(64 * 1024):
+                    content += chunk
+                    if len(content) > self.MAX_IMAGE_SIZE:
+                        return None
+                return bytes(content)
+        except requests.RequestException:
+            return None
     
     def _is_valid_image_url(self, url):
         """유효한 이미지 URL인지 확인.
@@ -508,75 +1148,49 @@ class FastCampusCrawler:
         if not url or len(url) < 10:
             return False
         
-        url_lower = url.lower()
-        
-        # URL에 이미지 확장자가 있거나, CDN URL인 경우
-        return (any(ext in url_lower for ext in self.VALID_IMAGE_EXTENSIONS) 
-                or 'cdn' in url_lower 
-                or 'image' in url_lower
-                or 'thumbnail' in url_lower)
+        # URL에 이미지 확장자가 있거나, CDN URL인 경우 (한 번의 정규식 검색)
+        return self.IMAGE_URL_PATTERN.search(url) is not None
     
-    def _collect_thumbnails(self, card, course_url):
+    def _collect_thumbnails(self, image_urls, course_url):
         """썸네일 이미지 수집.
         
         Args:
-            card: 강의 카드 요소
+            image_urls (list): 카드에서 선택자 우선순위 순으로 읽은 이미지 src 목록
             course_url (str): 강의 URL
         """
         course_name = course_url.split('/')[-1]
         thumbnail_dir = self.output_dir / "sumnail_images" / course_name
         thumbnail_dir.mkdir(parents=True, exist_ok=True)
         
-        # 정확한 썸네일 선택자만 사용 (우선순위 순)
-        img_selectors = [
-            'img[alt="강의 대표이미지"]',  # 가장 정확한 선택자
-            'img[class*="CourseCard"][data-nimg="fill"]',  # 조합 선택자
-            'img[class*="CourseCard"]',  # CourseCard 관련
-            'img[data-nimg="fill"]'  # Next.js 이미지
-        ]
+        # 원본 src 기준으로 먼저 중복을 거른 뒤 정규화/검증
+        candidates = []
+        for url in dict.fromkeys(image_urls):
+            url = self._normalize_url(url)
+            if url not in candidates and self._is_valid_image_url(url):
+                candidates.append(url)
         
+        # 다운로드는 병렬로 하고, 저장은 우선순위 순으로 최대 개수까지만
+        futures = [self._img_pool.submit(self._fetch_image, url)
+                   for url in candidates]
         saved_count = 0
-        saved_urls = set()  # 중복 URL 체크용
         
-        for selector in img_selectors:
+        for url, future in zip(candidates, futures):
             if saved_count >= self.MAX_THUMBNAILS:
-                break
-                
+                future.cancel()
+                continue
+            
             try:
-                images = card.locator(selector).all()
-                for img in images:
-                    if saved_count >= self.MAX_THUMBNAILS:
-                        break
-                        
-                    url = (img.get_attribute('src') or 
-                           img.get_attribute('data-src'))
+                content = future.result()
+                
+                if content and len(content) > self.MIN_IMAGE_SIZE:
+                    ext = (os.path.splitext(urlparse(url).path)[1] 
+                           or '.webp')
+                    filename = f"thumbnail_{saved_count + 1}{ext}"
+                    self._write_image(url, content, thumbnail_dir / filename)
                     
-                    if url:
-                        url = self._normalize_url(url)
-                        
-                        # 중복 URL 체크
-                        if url in saved_urls:
-                            continue
-                        
-                        # 유효한 이미지 URL인지 확인
-                        if not self._is_valid_image_url(url):
-                            continue
-                            
-                        response = self._download_image(url)
-                        
-                        if (response and 
-                            len(response.content) > self.MIN_IMAGE_SIZE):
-                            ext = (os.path.splitext(urlparse(url).path)[1] 
-                                   or '.webp')
-                            filename = f"thumbnail_{saved_count + 1}{ext}"
-                            
-                            with open(thumbnail_dir / filename, 'wb') as f:
-                                f.write(response.content)
-                            
-                            saved_urls.add(url)
-                            saved_count += 1
-                            self._log_progress(f"썸네일 이미지 저장: {filename} "
-                                             f"({len(response.content)} bytes)")
+                    saved_count += 1
+                    self._log_progress(f"썸네일 이미지 저장: {filename} "
+                                     f"({len(content)} bytes)")
             except Exception as e:
                 self._log_error(f"썸네일 이미지 처리 중 오류", e)
                 continue
@@ -591,53 +1205,36 @@ class FastCampusCrawler:
             bool: 추출 성공 여부
         """
         try:
-            json_scripts = page.locator('script[type="application/json"]').all()
+            # 스크립트 내용을 한 번의 evaluate로 읽음 (Next.js 페이지 데이터 우선)
+            json_texts = page.evaluate(self.JSON_SCRIPTS_SCRIPT)
             
-            for script in json_scripts:
+            for json_text in json_texts:
                 try:
-                    json_text = script.text_content()
                     if not json_text:
                         continue
                         
-                    data = json.loads(json_text)
+                    data = orjson.loads(json_text)
                     
-                    # JSON 구조 탐색하여 강의 데이터 찾기
-                    def find_courses(obj, path=""):
-                        courses = []
-                        
+                    # JSON 구조를 스택으로 순회하며 강의 데이터 찾기
+                    found = 0
+                    stack = [data]
+                    while stack:
+                        obj = stack.pop()
                         if isinstance(obj, dict):
-                            if 'publicTitle' in obj and 'slug' in obj:
-                                # 강의 데이터 발견
-                                title = obj.get('publicTitle', '')
-                                slug = obj.get('slug', '')
-                                if title and slug:
-                                    courses.append({
-                                        'title': title,
-                                        'slug': slug,
-                                        'url': f"https://fastcampus.co.kr/{slug}"
-                                    })
-                            
-                            # 중첩된 객체들도 탐색
-                            for key, value in obj.items():
-                                courses.extend(find_courses(value, 
-                                                          f"{path}.{key}"))
-                                
+                            title = obj.get('publicTitle')
+                            slug = obj.get('slug')
+                            if title and slug:
+                                # 강의 데이터 발견 - URL -> 제목 매핑 저장
+                                self.course_titles[
+                                    f"https://fastcampus.co.kr/{slug}"] = title
+                                self._log_progress(f"강의 제목 매핑: {title}")
+                                found += 1
+                            stack.extend(obj.values())
                         elif isinstance(obj, list):
-                            for i, item in enumerate(obj):
-                                courses.extend(find_courses(item, 
-                                                          f"{path}[{i}]"))
-                        
-                        return courses
+                            stack.extend(obj)
                     
-                    courses = find_courses(data)
-                    
-                    # URL -> 제목 매핑 저장
-                    for course in courses:
-                        self.course_titles[course['url']] = course['title']
-                        self._log_progress(f"강의 제목 매핑: {course['title']}")
-                    
-                    if courses:
-                        self._log_progress(f"JSON에서 {len(courses)}개 강의 제목 "
+                    if found:
+                        self._log_progress(f"JSON에서 {found}개 강의 제목 "
                                          f"추출 완료")
                         return True
                         
@@ -650,83 +1247,107 @@ class FastCampusCrawler:
         
         return False
     
-    def _extract_courses(self, page, subcategory, max_courses=3):
+    def _collect_subcategory_courses(self, subcategory, max_courses=3,
+                                     claims=None):
+        """워커 스레드에서 하위 카테고리 강의 수집.
+        
+        Args:
+            subcategory (dict): 하위 카테고리 정보
+            max_courses (int, optional): 최대 수집할 강의 수 (None이면 전체)
+            claims (dict, optional): 이 작업이 선점한 강의 URL 기록
+                ('urls': 선점한 URL 목록, 'abandoned': 결과를 버렸는지 여부)
+            
+        Returns:
+            list: 수집된 강의 정보 리스트
+        """
+        # 썸네일은 src 속성만 읽고 requests로 받으므로 브라우저 이미지 로드는 불필요
+        with self._worker_page(block_images=True) as page:
+            return self._extract_courses(page, subcategory, max_courses,
+                                         claims)
+    
+    def _extract_courses(self, page, subcategory, max_courses=3, claims=None):
         """강의 정보 추출.
         
         Args:
             page: Playwright 페이지 객체
             subcategory (dict): 하위 카테고리 정보
-            max_courses (int): 최대 수집할 강의 수
+            max_courses (int, optional): 최대 수집할 강의 수 (None이면 전체)
+            claims (dict, optional): 이 작업이 선점한 강의 URL 기록
+                ('urls': 선점한 URL 목록, 'abandoned': 결과를 버렸는지 여부)
+            
+        Returns:
+            list: 수집된 강의 정보 리스트
         """
         self._log_progress(f"강의 수집 시작: {subcategory['메인카테고리']} > "
                           f"{subcategory['하위카테고리']}")
         
-        if not self._safe_page_load(page, subcategory['하위카테고리링크']):
+        courses = []
+        if not self._safe_page_load(page, subcategory['하위카테고리링크'],
+                                    wait_selector=self.SELECTORS['course_link']):
             self._log_error(f"페이지 로드 실패: {subcategory['하위카테고리링크']}")
-            return
+            return courses
         
-        self._scroll_page(page)
-        page.wait_for_timeout(3000)
+        self._scroll_page(page, self.SELECTORS['course_link'])
         
         # 먼저 JSON에서 강의 제목들 추출
         self._extract_course_titles_from_json(page)
         
-        # 강의 카드 컨테이너 찾기 - 여러 선택자 시도
-        card_selectors = [
-            '[data-e2e="course-card"]',
-            '.course-card', 
-            '.course-item',
-            'div[class*="CourseCard"]',
-            'div[class*="courseCard"]',
-            'div[class*="course-card"]',
-            'article[class*="course"]',
-            'div[class*="card"]'
-        ]
-        
-        cards = []
-        for selector in card_selectors:
-            found_cards = page.locator(selector).all()
-            if found_cards:
-                cards = found_cards
-                self._log_progress(f"강의 카드 발견: {len(cards)}개 "
-                                 f"(선택자: {selector})")
-                break
-        
-        if not cards:
+        # 강의 카드 컨테이너 찾기 - 이전 페이지에서 성공한 선택자부터 시도
+        selectors = self._prioritize(self.COURSE_CARD_SELECTORS,
+                                     self._card_selector)
+        link_selector = self.SELECTORS['course_link']
+        
+        # 카드 탐색과 링크/제목 읽기를 카드별 호출 없이 한 번에 처리
+        found = page.evaluate(self.COURSE_CARDS_SCRIPT,
+                              [list(selectors), link_selector,
+                               *self._card_script_selectors])
+        
+        card_selector, cards = found['selector'], found['cards']
+        if card_selector != link_selector:
+            self._card_selector = card_selector
+            self._log_progress(f"강의 카드 발견: {len(cards)}개 "
+                             f"(선택자: {card_selector})")
+        else:
             # 마지막 fallback - 링크 요소들을 카드로 사용
-            cards = page.locator(self.SELECTORS['course_link']).all()
             self._log_progress(f"대체 선택자로 강의 카드 발견: {len(cards)}개 "
-                             f"(선택자: {self.SELECTORS['course_link']})")
+                             f"(선택자: {link_selector})")
         
         collected = 0
         for i, card in enumerate(cards, 1):
-            if collected >= max_courses:
+            if max_courses is not None and collected >= max_courses:
                 break
                 
             try:
-                url = self._extract_course_url(card)
-                if not url:
-                    continue
-                
+                url = card['url']
                 if url.startswith('/'):
                     url = urljoin(self.base_url, url)
                 
-                if '/event_online_' in url or url in self.seen_urls:
-                    continue
+                # 추적 파라미터만 다른 링크는 같은 강의로 취급
+                url = self._canonical_url(url)
+                
+                # 여러 워커가 동시에 같은 강의를 발견할 수 있으므로 잠금 후 확인
+                with self._seen_lock:
+                    # 시간 초과로 결과를 버린 작업은 더 이상 강의를 선점하지 않음
+                    if claims is not None and claims['abandoned']:
+                        break
+                    if url in self.seen_urls:
+                        continue
+                    self.seen_urls.add(url)
+                    if claims is not None:
+                        claims['urls'].append(url)
                 
-                self.seen_urls.add(url)
                 title = self._extract_title(card, url)
                 
-                self.data['courses'].append({
+                courses.append({
                     "메인카테고리": subcategory['메인카테고리'],
                     "하위카테고리": subcategory['하위카테고리'],
                     "강의제목": title,
                     "강의링크": url,
-                    "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    "수집일시": self._run_timestamp
                 })
                 
                 self._log_progress(f"강의 발견: {title}")
-                self._collect_thumbnails(card, url)
+                self._collect_thumbnails(card['images'], url)
                 collected += 1
                 
             except Exception as e:
@@ -734,30 +1355,38 @@ class FastCampusCrawler:
                 continue
         
         self._log_progress(f"강의 수집 완료: {collected}개")
+        return courses
     
-    def _extract_page_content(self, soup):
+    def _extract_page_content(self, tree):
         """페이지 텍스트 콘텐츠 추출.
         
+        트리에서 script/style/nav/footer/header 요소를 제거한다.
+        
         Args:
-            soup: BeautifulSoup 객체
+            tree: lxml HTML 트리
             
         Returns:
             str: 추출된 텍스트
         """
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-        
-        main_content = soup.find('main') or soup.find('body') or soup
-        text = main_content.get_text()
-        
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        return '\n'.join(lines) if lines else "텍스트 없음"
+        etree.strip_elements(tree, 'script', 'style', 'nav', 'footer', 'header',
+                             with_tail=False)
+        
+        main_content = tree.find('.//main')
+        if main_content is None:
+            main_content = tree.find('.//body')
+        if main_content is None:
+            main_content = tree
+        text = main_content.text_content()
+        
+        # 줄마다 strip을 한 번만 수행
+        stripped = (line.strip() for line in text.split('\n'))
+        return '\n'.join(line for line in stripped if line) or "텍스트 없음"
     
-    def _extract_course_images(self, soup, course_url):
+    def _extract_course_images(self, tree, course_url):
         """강의 페이지 이미지 추출.
         
         Args:
-            soup: BeautifulSoup 객체
+            tree: lxml HTML 트리
             course_url (str): 강의 URL
             
         Returns:
@@ -768,33 +1397,61 @@ class FastCampusCrawler:
         image_dir = self.output_dir / "lect_images" / course_name
         image_dir.mkdir(parents=True, exist_ok=True)
         
-        for i, img in enumerate(soup.find_all('img')):
-            try:
-                url = (img.get('src') or img.get('data-src'))
-                if not url:
-                    continue
-                
+        # 이미지 URL을 먼저 모두 모은 뒤 병렬로 다운로드
+        downloads = []
+        for i, img in enumerate(tree.iter('img')):
+            url = (img.get('src') or img.get('data-src'))
+            if url:
                 url = self._normalize_url(url)
-                response = self._download_image(url)
+                downloads.append((i, url, self._img_pool.submit(
+                    self._fetch_image, url)))
+        
+        # 파일명과 결과 순서는 페이지 내 이미지 순서를 유지
+        for i, url, future in downloads:
+            try:
+                content = future.result()
                 
-                if response and len(response.content) > 0:
+                if content:
                     ext = os.path.splitext(urlparse(url).path)[1] or '.jpg'
                     filename = f"image_{i+1}{ext}"
-                    
-                    with open(image_dir / filename, 'wb') as f:
-                        f.write(response.content)
+                    self._write_image(url, content, image_dir / filename)
                     
                     images.append({
                         "url": url,
                         "filename": filename,
                         "local_path": str(image_dir / filename),
-                        "size_bytes": len(response.content)
+                        "size_bytes": len(content)
                     })
             except Exception:
                 continue
         
         return images
     
+    def _collect_course_detail(self, course_url):
+        """워커 스레드에서 강의 상세 정보 수집.
+        
+        Args:
+            course_url (str): 강의 URL
+            
+        Returns:
+            dict: 강의 상세 정보 또는 None
+        """
+        with self._detail_cache_lock:
+            cached = self._detail_cache.get(course_url)
+        if cached and time.time() - cached['fetched'] < self.PAGE_CACHE_TTL:
+            self._log_progress(f"최근 수집한 상세 정보 재사용: {course_url}")
+            return cached['detail']
+        
+        # 상세 페이지는 이미지가 로드된 상태의 HTML을 저장하므로 이미지 차단 없음
+        with self._worker_page() as page:
+            detail = self._extract_course_detail(page, course_url)
+        
+        if detail:
+            with self._detail_cache_lock:
+                self._detail_cache[course_url] = {'fetched': time.time(),
+                                                  'detail': detail}
+        return detail
+    
     def _extract_course_detail(self, page, course_url):
         """강의 상세 정보 추출.
         
@@ -808,29 +1465,31 @@ class FastCampusCrawler:
         course_name = course_url.split('/')[-1]
         self._log_progress(f"강의 상세 정보 수집: {course_name}")
         
-        if not self._safe_page_load(page, course_url):
+        if not self._safe_page_load(page, course_url, wait_selector='h1'):
             self._log_error(f"강의 페이지 로드 실패: {course_url}")
             return None
         
-        self._scroll_page(page)
-        page.wait_for_timeout(3000)
+        try:
+            # 고정 대기 대신 페이지 이미지가 모두 로드(또는 실패)될 때까지만 대기
+            page.wait_for_function(
+                "() => Array.from(document.images).every(img => img.complete)",
+                timeout=self.TIMEOUTS['image_load'])
+        except PlaywrightTimeoutError:
+            pass  # 늦는 이미지가 있어도 그때까지의 HTML 저장
         
         html_content = page.content()
         safe_name = course_url.split('/')[-1]
         
-        with open(self.output_dir / f"courses/{safe_name}.html", 
-                  'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self._write_in_background(self.output_dir / f"courses/{safe_name}.html",
+                                  html_content)
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        tree = lxml_html.fromstring(html_content)
         
-        title_selectors = ['h1', '[data-e2e="course-title"]', '.title']
         title = "제목 없음"
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                title = element.get_text().strip()
+        for xpath in self.TITLE_XPATHS:
+            elements = tree.xpath(xpath)
+            if elements and elements[0].text_content().strip():
+                title = elements[0].text_content().strip()
                 if title != "root layout":
                     break
         
@@ -838,10 +1497,10 @@ class FastCampusCrawler:
         
         return {
             "강의명": title,
-            "추출된_텍스트": self._extract_page_content(soup),
+            "추출된_텍스트": self._extract_page_content(tree),
             "강의링크": course_url,
-            "수집일시": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "이미지_정보": self._extract_course_images(soup, course_url)
+            "수집일시": self._run_timestamp,
+            "이미지_정보": self._extract_course_images(tree, course_url)
         }
     
     def _validate_data(self, data_type, data):
@@ -865,9 +1524,7 @@ class FastCampusCrawler:
                                        all(item.get('하위카테고리') 
                                            for item in d)),
             "courses": lambda d: all(item.get('강의제목') != "제목 없음" 
-                                   for item in d),
-            "course_details": lambda d: all(item.get('강의명') != "제목 없음" 
-                                          for item in d)
+                                   for item in d)
         }
         
         validator = validators.get(data_type)
@@ -884,12 +1541,21 @@ class FastCampusCrawler:
         
         if data and self._validate_data(data_type, data):
             json_path = self.output_dir / "json_files" / filename
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 인코딩까지 I/O 스레드에서 처리하고 수집은 다음 단계로 바로 진행
+            future = self._io_executor.submit(self._write_json, json_path,
+                                              list(data))
+            self._io_futures.append(future)
+    
+    @staticmethod
+    def _write_json(path, data):
+        """JSON 인코딩 후 저장 (json.dump(ensure_ascii=False, indent=2)와 같은 출력)."""
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     def run(self):
         """크롤링 실행."""
         self.start_time = time.time()
+        # 수집일시는 실행 단위로 한 번만 포맷
+        self._run_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self._log_progress("FastCampus 크롤링 시작!")
         
         with sync_playwright() as p:
@@ -904,61 +1570,115 @@ class FastCampusCrawler:
                 
                 self._log_progress("메인 페이지 로드 완료")
                 
-                # 메인 카테고리 수집
+                # 메인 카테고리 수집 (저장은 다음 단계와 겹쳐 진행)
                 self._extract_main_categories(page)
+                self._save_json(self.data['main_categories'], 
+                               "main_categories.json")
                 
                 # 하위 카테고리 수집
                 self._extract_sub_categories(page)
+                self._save_json(self.data['sub_categories'], 
+                               "sub_categories.json")
                 
                 # HTML 저장
                 self._log_step_start("HTML 저장")
-                for i, category in enumerate(self.data['main_categories'][:2], 1):
-                    self._log_progress(f"메인 카테고리 HTML 저장 ({i}/2): "
-                                     f"{category['메인카테고리']}")
-                    if self._safe_page_load(page, category['메인카테고리링크']):
-                        self._scroll_page(page)
-                        self._save_html(page, category['메인카테고리'], 
-                                      "main_categories")
+                main_categories = list(islice(self.data['main_categories'],
+                                              self.limits['main']))
+                sub_categories = list(islice(self.data['sub_categories'],
+                                             self.limits['sub']))
+                html_jobs = [
+                    (f"메인 카테고리 HTML 저장 ({i}/{len(main_categories)})",
+                     category['메인카테고리링크'], category['메인카테고리'],
+                     "main_categories")
+                    for i, category in enumerate(main_categories, 1)
+                ] + [
+                    (f"하위 카테고리 HTML 저장 ({i}/{len(sub_categories)})",
+                     category['하위카테고리링크'], category['하위카테고리'],
+                     "sub_categories")
+                    for i, category in enumerate(sub_categories, 1)
+                ]
+                # 카테고리 페이지들을 워커 브라우저에서 동시에 열어 저장
+                futures = [self.executor.submit(self._save_category_html,
+                                                url, name, category_type)
+                           for _, url, name, category_type in html_jobs]
                 
-                for i, category in enumerate(self.data['sub_categories'][:2], 1):
-                    self._log_progress(f"하위 카테고리 HTML 저장 ({i}/2): "
-                                     f"{category['하위카테고리']}")
-                    if self._safe_page_load(page, category['하위카테고리링크']):
-                        self._scroll_page(page)
-                        self._save_html(page, category['하위카테고리'], 
-                                      "sub_categories")
+                for (label, _, name, _), future in zip(html_jobs, futures):
+                    try:
+                        if self._task_result(future):
+                            self._log_progress(f"{label}: {name}")
+                        else:
+                            self._log_error(f"{label} 실패: {name}")
+                    except Exception as e:
+                        self._log_error(f"{label} 실패: {name}", e)
                 self._log_step_complete("HTML 저장")
                 
                 # 강의 목록 수집
                 self._log_step_start("강의 목록 수집")
-                for i, subcategory in enumerate(self.data['sub_categories'][:2], 1):
-                    self._log_progress(f"강의 수집 진행 ({i}/2): "
-                                     f"{subcategory['하위카테고리']}")
-                    self._extract_courses(page, subcategory, max_courses=2)
+                claims = [{'urls': [], 'abandoned': False}
+                          for _ in sub_categories]
+                futures = [self.executor.submit(self._collect_subcategory_courses,
+                                                subcategory,
+                                                max_courses=self.limits['courses'],
+                                                claims=claim)
+                           for subcategory, claim in zip(sub_categories, claims)]
+                
+                # 결과는 하위 카테고리 순서대로 합쳐 수집 순서를 유지
+                for i, (subcategory, claim, future) in enumerate(
+                        zip(sub_categories, claims, futures), 1):
+                    try:
+                        self.data['courses'].extend(self._task_result(future))
+                        self._log_progress(f"강의 수집 진행 ({i}/{len(futures)}): "
+                                         f"{subcategory['하위카테고리']}")
+                    except FutureTimeoutError as e:
+                        # 실행 중인 작업은 멈출 수 없으므로 이후 선점을 막고,
+                        # 이미 선점한 강의는 아직 수집 전인 하위 카테고리에서
+                        # 다시 찾을 수 있도록 되돌림
+                        with self._seen_lock:
+                            claim['abandoned'] = True
+                            self.seen_urls.difference_update(claim['urls'])
+                        self._log_error(f"강의 수집 결과 제외 (선점한 강의 "
+                                      f"{len(claim['urls'])}개 반환): "
+                                      f"{subcategory['하위카테고리']}", e)
+                    except Exception as e:
+                        self._log_error(f"강의 수집 실패: "
+                                      f"{subcategory['하위카테고리']}", e)
                 self._log_step_complete("강의 목록 수집", 
                                       len(self.data['courses']))
+                self._save_json(self.data['courses'], "courses_list.json")
                 
                 # 강의 상세 정보 수집
                 self._log_step_start("강의 상세 정보 수집")
-                for i, course in enumerate(self.data['courses'][:2], 1):
-                    self._log_progress(f"강의 상세 정보 수집 ({i}/2): "
-                                     f"{course['강의제목']}")
-                    detail = self._extract_course_detail(page, 
-                                                       course['강의링크'])
+                courses = list(islice(self.data['courses'],
+                                      self.limits['details']))
+                # 수집되는 즉시 한 줄씩 추가 저장 (중단되어도 앞선 결과 보존)
+                ndjson_path = self.output_dir / "json_files" / "course_details.ndjson"
+                ndjson_path.unlink(missing_ok=True)
+                futures = [self.executor.submit(self._collect_course_detail,
+                                                course['강의링크'])
+                           for course in courses]
+                
+                # 결과는 강의 순서대로 합쳐 수집 순서를 유지
+                for i, (course, future) in enumerate(zip(courses, futures), 1):
+                    try:
+                        detail = self._task_result(future)
+                        self._log_progress(f"강의 상세 정보 수집 "
+                                         f"({i}/{len(futures)}): "
+                                         f"{course['강의제목']}")
+                    except Exception as e:
+                        self._log_error(f"강의 상세 정보 수집 실패: "
+                                      f"{course['강의제목']}", e)
+                        continue
                     if detail:
-                        self.data['course_details'].append(detail)
+                        self.course_detail_count += 1
+                        self._append_ndjson(ndjson_path, detail)
                 self._log_step_complete("강의 상세 정보 수집", 
-                                      len(self.data['course_details']))
+                                      self.course_detail_count)
                 
                 # 데이터 저장
+                # 목록 JSON은 각 단계 직후, 강의 상세는 수집하면서
+                # course_details.ndjson에 이미 저장을 맡겼으므로 기록 완료만 대기
                 self._log_step_start("데이터 저장")
-                self._save_json(self.data['main_categories'], 
-                               "main_categories.json")
-                self._save_json(self.data['sub_categories'], 
-                               "sub_categories.json")
-                self._save_json(self.data['courses'], "courses_list.json")
-                self._save_json(self.data['course_details'], 
-                               "course_details.json")
+                self._wait_for_io()
                 self._log_step_complete("데이터 저장")
                 
                 # 완료
@@ -973,13 +1693,20 @@ class FastCampusCrawler:
                 self._log_progress(f"   - 강의 목록: "
                                  f"{len(self.data['courses'])}개")
                 self._log_progress(f"   - 강의 상세: "
-                                 f"{len(self.data['course_details'])}개")
+                                 f"{self.course_detail_count}개")
                 
             except Exception as e:
                 self._log_error("크롤링 중 치명적 오류 발생", e)
             finally:
-                browser.close()
-                self._log_progress("브라우저 종료")
+                # 중간에 실패해도 그때까지 받은 이미지/상세 캐시는 보존
+                self._save_image_cache()
+                self._save_detail_cache()
+                try:
+                    browser.close()
+                    self._log_progress("브라우저 종료")
+                except Exception as e:
+                    self._log_error("브라우저 종료 실패", e)
+                self.close()
 
 def main():
     """Application entry point."""